@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
 
 from starlite_saqlalchemy.settings import app
 from starlite_saqlalchemy.utils import case_insensitive_string_compare
@@ -46,5 +47,9 @@ for package in ("redis", "saq", "sentry_sdk", "sqlalchemy"):
             case "sqlalchemy":  # pragma: no cover
                 IS_SQLALCHEMY_INSTALLED = False
 
-SERVICE_OBJECT_IDENTITY_MAP: MutableMapping[str, type[Service[Any]]] = {}
-"""Used by the worker to lookup methods for service object callbacks."""
+SERVICE_OBJECT_IDENTITY_MAP: MutableMapping[str, type[Service[Any]]] = WeakValueDictionary()
+"""Used by the worker to lookup methods for service object callbacks.
+
+Holds weak references, so service types that are no longer referenced elsewhere, e.g., those
+created dynamically in tests, don't accumulate for the life of the process.
+"""
@@ -8,7 +8,7 @@ from uuid import UUID
 import msgspec
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from starlite_saqlalchemy import settings
 
@@ -28,15 +28,40 @@ def _default(val: Any) -> str:
 
 _msgspec_json_encoder = msgspec.json.Encoder(enc_hook=_default)
 
+
+def _jsonb_encoder(bin_value: bytes) -> bytes:
+    # \x01 is the prefix for jsonb used by PostgreSQL.
+    # asyncpg requires it when format='binary'
+    return b"\x01" + bin_value
+
+
+def _jsonb_decoder(bin_value: bytes) -> Any:
+    # the byte is the \x01 prefix for jsonb used by PostgreSQL.
+    # asyncpg returns it when format='binary'
+    return msgspec.json.decode(bin_value[1:])
+
+
+# `NullPool` rejects the arguments that size and order a queue pool
+_queue_pool_kwargs: dict[str, Any] = (
+    {}
+    if settings.db.POOL_DISABLE
+    else {
+        "max_overflow": settings.db.POOL_MAX_OVERFLOW,
+        "pool_size": settings.db.POOL_SIZE,
+        "pool_timeout": settings.db.POOL_TIMEOUT,
+        "pool_use_lifo": settings.db.POOL_USE_LIFO,
+    }
+)
+
 engine = create_async_engine(
     settings.db.URL,
     echo=settings.db.ECHO,
     echo_pool=settings.db.ECHO_POOL,
     json_serializer=_msgspec_json_encoder.encode,
-    max_overflow=settings.db.POOL_MAX_OVERFLOW,
-    pool_size=settings.db.POOL_SIZE,
-    pool_timeout=settings.db.POOL_TIMEOUT,
-    poolclass=NullPool if settings.db.POOL_DISABLE else None,
+    pool_pre_ping=settings.db.POOL_PRE_PING,
+    pool_recycle=settings.db.POOL_RECYCLE,
+    poolclass=NullPool if settings.db.POOL_DISABLE else AsyncAdaptedQueuePool,
+    **_queue_pool_kwargs,
 )
 """Database connection engine.
 
@@ -46,9 +71,14 @@ Overrides default JSON serializer to use `msgspec`.
 
 See [`create_async_engine()`][sqlalchemy.ext.asyncio.create_async_engine] for detailed instructions.
 """
-async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(engine)
+async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    engine, expire_on_commit=False
+)
 """Database session factory.
 
+Instances are not expired on commit, so accessing their attributes after the request's session
+has committed doesn't emit implicit IO to reload them.
+
 See [`async_sessionmaker()`][sqlalchemy.ext.asyncio.async_sessionmaker].
 """
 
@@ -66,22 +96,11 @@ def _sqla_on_connect(dbapi_connection: Any, _: Any) -> Any:  # pragma: no cover
     https://github.com/sqlalchemy/sqlalchemy/blob/14bfbadfdf9260a1c40f63b31641b27fe9de12a0/lib/sqlalchemy/dialects/postgresql/asyncpg.py#L934
     pylint: disable=line-too-long
     """
-
-    def encoder(bin_value: bytes) -> bytes:
-        # \x01 is the prefix for jsonb used by PostgreSQL.
-        # asyncpg requires it when format='binary'
-        return b"\x01" + bin_value
-
-    def decoder(bin_value: bytes) -> Any:
-        # the byte is the \x01 prefix for jsonb used by PostgreSQL.
-        # asyncpg returns it when format='binary'
-        return msgspec.json.decode(bin_value[1:])
-
     dbapi_connection.await_(
         dbapi_connection.driver_connection.set_type_codec(
             "jsonb",
-            encoder=encoder,
-            decoder=decoder,
+            encoder=_jsonb_encoder,
+            decoder=_jsonb_decoder,
             schema="pg_catalog",
             format="binary",
         )
@@ -49,6 +49,9 @@ __all__ = ("FromMapped",)
 
 AnyDeclarative = TypeVar("AnyDeclarative", bound=DeclarativeBase)
 
+_dto_cache: dict[tuple[type[Any], type[Any], Purpose, frozenset[str]], type[Any]] = {}
+"""DTO types built by `FromMapped.__class_getitem__()`, keyed by DTO base, model and config."""
+
 
 class FromMapped(BaseModel, Generic[AnyDeclarative]):
     """Produce an SQLAlchemy instance with values from a pydantic model."""
@@ -71,8 +74,9 @@ class FromMapped(BaseModel, Generic[AnyDeclarative]):
                 of `DTOConfig`.
 
         Returns:
-            A new Pydantic model type, with `cls` as its base class, and additional fields derived
-            from the SQLAlchemy model, respecting any declared configuration.
+            A Pydantic model type, with `cls` as its base class, and additional fields derived
+            from the SQLAlchemy model, respecting any declared configuration. The type is built
+            once for each combination of `cls`, model and configuration.
         """
         if get_origin(item) is Annotated:
             model, pos_arg, *_ = get_args(item)
@@ -82,12 +86,15 @@ class FromMapped(BaseModel, Generic[AnyDeclarative]):
                 dto_config = pos_arg
         else:
             raise ValueError("Unexpected type annotation for `FromMapped`.")
-        return cls._factory(
-            cls.__name__,
-            cast("type[AnyDeclarative]", model),
-            dto_config.purpose,
-            exclude=dto_config.exclude,
-        )
+        key = (cls, model, dto_config.purpose, frozenset(dto_config.exclude))
+        if key not in _dto_cache:
+            _dto_cache[key] = cls._factory(
+                cls.__name__,
+                cast("type[AnyDeclarative]", model),
+                dto_config.purpose,
+                exclude=dto_config.exclude,
+            )
+        return _dto_cache[key]  # type:ignore[no-any-return]
 
     # pylint: disable=arguments-differ
     def __init_subclass__(cls, model: type[AnyDeclarative] | None = None, **kwargs: Any) -> None:
@@ -28,6 +28,32 @@ async def _db_ready() -> None:
                 logger.info("DB OK!")
                 break
 
+        await _warm_db_pool()
+
+
+async def _warm_db_pool() -> None:
+    """Open connections up to `DB_POOL_PRE_WARM` and return them to the pool.
+
+    Warming is optional, so connections that fail to open are logged rather than raised.
+    """
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from starlite_saqlalchemy.db import engine
+
+    if settings.db.POOL_DISABLE:
+        return
+    size = min(settings.db.POOL_PRE_WARM, settings.db.POOL_SIZE)
+    if size > 0:
+        results = await asyncio.gather(
+            *(engine.connect() for _ in range(size)), return_exceptions=True
+        )
+        connections = [result for result in results if isinstance(result, AsyncConnection)]
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("DB pool warm-up connection failed: %s", result)
+        await asyncio.gather(*(conn.close() for conn in connections))
+        logger.info("DB pool warmed with %d connections", len(connections))
+
 
 async def _redis_ready() -> None:
     """Wait for redis to become responsive."""
@@ -47,7 +73,9 @@ async def _redis_ready() -> None:
 
 async def before_startup_handler(_: starlite.Starlite) -> None:
     """Do things before the app starts up."""
+    checks = []
     if settings.app.CHECK_DB_READY:
-        await _db_ready()
+        checks.append(_db_ready())
     if settings.app.CHECK_REDIS_READY:
-        await _redis_ready()
+        checks.append(_redis_ready())
+    await asyncio.gather(*checks)
@@ -18,6 +18,8 @@ RepoT = TypeVar("RepoT", bound="AbstractRepository")
 class AbstractRepository(Generic[T], metaclass=ABCMeta):
     """Interface for persistent data interaction."""
 
+    __slots__ = ()
+
     model_type: type[T]
     """Type of object represented by the repository."""
     id_attribute = "id"
@@ -38,6 +40,19 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             The added instance.
         """
 
+    async def add_many(self, data: list[T]) -> list[T]:
+        """Add multiple `data` to the collection.
+
+        Adds each instance in turn, implementations can override to add them in bulk.
+
+        Args:
+            data: Instances to be added to the collection.
+
+        Returns:
+            The added instances.
+        """
+        return [await self.add(datum) for datum in data]
+
     @abstractmethod
     async def delete(self, id_: Any) -> T:
         """Delete instance identified by `id_`.
@@ -52,6 +67,26 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             RepositoryNotFoundException: If no instance found identified by `id_`.
         """
 
+    async def delete_many(self, ids: list[Any]) -> list[T]:
+        """Delete instances identified by `ids`.
+
+        Identifiers that don't exist in the collection are ignored. Deletes each instance in turn,
+        implementations can override to delete them in bulk.
+
+        Args:
+            ids: Identifiers of instances to be deleted.
+
+        Returns:
+            The deleted instances.
+        """
+        deleted = []
+        for id_ in ids:
+            try:
+                deleted.append(await self.delete(id_))
+            except NotFoundError:
+                continue
+        return deleted
+
     @abstractmethod
     async def get(self, id_: Any) -> T:
         """Get instance identified by `id_`.
@@ -93,6 +128,24 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             RepositoryNotFoundException: If no instance found with same identifier as `data`.
         """
 
+    async def update_many(self, data: list[T]) -> list[T]:
+        """Update instances with the attribute values present on each of `data`.
+
+        Updates each instance in turn, implementations can override to update them in bulk.
+
+        Args:
+            data: Instances that should each have a value for `self.id_attribute` that exists in
+                the collection.
+
+        Returns:
+            The updated instances, in the same order as `data`.
+
+        Raises:
+            RepositoryNotFoundException: If no instance found with same identifier as any of
+                `data`.
+        """
+        return [await self.update(datum) for datum in data]
+
     @abstractmethod
     async def upsert(self, data: T) -> T:
         """Update or create instance.
@@ -4,7 +4,7 @@ from __future__ import annotations
 from collections import abc
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -34,6 +34,22 @@ class CollectionFilter(Generic[T]):
     """Values for `IN` clause."""
 
 
+@dataclass
+class Keyset:
+    """Data required to paginate a query by the value of a sortable column.
+
+    Unlike `OFFSET`, the database doesn't have to read and discard the rows of earlier pages, so
+    every page costs the same to retrieve.
+    """
+
+    field_name: str
+    """Name of the model attribute to order and filter on, should be unique."""
+    after: Any | None
+    """Filter results where field is greater than this, `None` for the first page."""
+    limit: int
+    """Value for `LIMIT` clause of query."""
+
+
 @dataclass
 class LimitOffset:
     """Data required to add limit/offset filtering to a query."""
@@ -1,27 +1,40 @@
 """SQLAlchemy-based implementation of the repository protocol."""
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
+from contextlib import suppress
+from dataclasses import fields
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeVar, cast
 
-from sqlalchemy import select, text
+from sqlalchemy import bindparam, delete, insert, inspect, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-
-from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm.exc import StaleDataError
+
+from starlite_saqlalchemy import constants, settings
+from starlite_saqlalchemy.exceptions import (
+    ConflictError,
+    NotFoundError,
+    StarliteSaqlalchemyError,
+)
 from starlite_saqlalchemy.repository.abc import AbstractRepository
 from starlite_saqlalchemy.repository.filters import (
     BeforeAfter,
     CollectionFilter,
+    Keyset,
     LimitOffset,
 )
 
 if TYPE_CHECKING:
     from collections import abc
-    from datetime import datetime
+    from collections.abc import AsyncIterator
+    from types import TracebackType
 
-    from sqlalchemy import Select
+    from sqlalchemy import Delete, Select
     from sqlalchemy.engine import Result
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
 
     from starlite_saqlalchemy.db import orm
     from starlite_saqlalchemy.repository.types import FilterTypes
@@ -36,8 +49,35 @@ ModelT = TypeVar("ModelT", bound="orm.Base | orm.AuditBase")
 SQLARepoT = TypeVar("SQLARepoT", bound="SQLAlchemyRepository")
 
 
-@contextmanager
-def wrap_sqlalchemy_exception() -> Any:
+class _SQLAlchemyExceptionWrapper:
+    """Stateless context manager behind `wrap_sqlalchemy_exception()`.
+
+    Translates exceptions in `__exit__()` directly, rather than through a generator like
+    `@contextmanager`, as it wraps every repository operation.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Literal[False]:
+        if isinstance(exc, IntegrityError):
+            raise ConflictError from exc
+        if isinstance(exc, SQLAlchemyError):
+            raise StarliteSaqlalchemyError(f"An exception occurred: {exc}") from exc
+        return False
+
+
+_sqlalchemy_exception_wrapper = _SQLAlchemyExceptionWrapper()
+
+
+def wrap_sqlalchemy_exception() -> _SQLAlchemyExceptionWrapper:
     """Do something within context to raise a `RepositoryException` chained
     from an original `SQLAlchemyError`.
 
@@ -49,16 +89,78 @@ def wrap_sqlalchemy_exception() -> Any:
         ...
         caught repository exception from <class 'sqlalchemy.exc.SQLAlchemyError'>
     """
-    try:
-        yield
-    except IntegrityError as exc:
-        raise ConflictError from exc
-    except SQLAlchemyError as exc:
-        raise StarliteSaqlalchemyError(f"An exception occurred: {exc}") from exc
+    return _sqlalchemy_exception_wrapper
 
 
 class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
-    """SQLAlchemy based implementation of the repository interface."""
+    """SQLAlchemy based implementation of the repository interface.
+
+    Instances are created for every request, so instance state is held in `__slots__`.
+    Subclasses that declare `__slots__ = ()` keep instances free of a `__dict__`.
+    """
+
+    __slots__ = ("session", "_select", "_params", "_get_cache")
+
+    bulk_copy_threshold: int = 100
+    """Minimum number of rows for `bulk_copy()` to use `COPY` rather than `add_many()`."""
+    use_returning: bool = False
+    """If `True`, `add()`, `update()`, `upsert()` and `delete()` each write and load back the
+    instance with a single `INSERT`, `UPDATE` or `DELETE ... RETURNING` statement, instead of
+    loading, flushing and refreshing the instance through the unit-of-work.
+
+    This bypasses the session's flush events, cascades and eager loads, so only use it for
+    models that are written without relationships. Only takes effect on PostgreSQL.
+    """
+    owns_session: bool = False
+    """Set `True` if the repository is the only user of its session.
+
+    Results of `list()` are then always detached with a single `session.expunge_all()`, rather
+    than one `session.expunge()` per instance. Otherwise, `expunge_all()` is only used when the
+    session holds nothing but the results.
+    """
+    list_yield_per: int | None = None
+    """If set, `list()` streams rows from a server-side cursor in batches of this size.
+
+    Instances are expunged batch by batch, so the session never holds the whole result.
+    """
+    iter_list_yield_per: int = 100
+    """Number of rows fetched from the server-side cursor per batch by `iter_list()`."""
+    cache_get: bool = False
+    """If `True`, `get()` returns the instance it already retrieved for the same identifier.
+
+    The cache belongs to the repository instance, so lives no longer than the request or job
+    that created it. Entries are dropped when `update()`, `upsert()` or `delete()` write to the
+    same identifier.
+    """
+
+    _filter_handlers: ClassVar[dict[type[Any], str]] = {
+        LimitOffset: "_apply_limit_offset_pagination",
+        BeforeAfter: "_filter_on_datetime_field",
+        CollectionFilter: "_filter_in_collection",
+        Keyset: "_apply_keyset_pagination",
+    }
+    """Name of the method that applies each type of filter to the select."""
+    _filter_dispatch: ClassVar[dict[type[Any], tuple[str, tuple[str, ...]]]] = {}
+    """Handler and handler argument field names of each filter type applied, see
+    `_get_filter_dispatch()`."""
+    _columns: ClassVar[dict[str, InstrumentedAttribute[Any]]] = {}
+    """Column attributes of `model_type` resolved by name, see `_get_column()`."""
+    _default_select: ClassVar[Select[tuple[Any]] | None] = None
+    """`select(model_type)`, built once per repository type."""
+    _kwargs_selects: ClassVar[dict[frozenset[str], Select[tuple[Any]]]] = {}
+    """Default select filtered on bound parameters, keyed by the names filtered on."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each repository type its own column and select caches.
+
+        Args:
+            **kwargs: Passed to `super().__init_subclass__()`.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._columns = {}
+        cls._default_select = None
+        cls._kwargs_selects = {}
+        cls._filter_dispatch = {}
 
     def __init__(
         self, *, session: AsyncSession, select_: Select[tuple[ModelT]] | None = None, **kwargs: Any
@@ -70,7 +172,9 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         """
         super().__init__(**kwargs)
         self.session = session
-        self._select = select(self.model_type) if select_ is None else select_
+        self._select = self._get_default_select() if select_ is None else select_
+        self._params: dict[str, Any] = {}
+        self._get_cache: dict[Any, ModelT] = {}
 
     async def add(self, data: ModelT) -> ModelT:
         """Add `data` to the collection.
@@ -82,12 +186,62 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             The added instance.
         """
         with wrap_sqlalchemy_exception():
-            instance = await self._attach_to_session(data)
-            await self.session.flush()
-            await self.session.refresh(instance)
+            if self._should_use_returning():
+                instance = await self._insert_returning(data)
+            else:
+                instance = await self._attach_to_session(data)
+                await self.session.flush()
+                await self.session.refresh(instance)
             self.session.expunge(instance)
             return instance
 
+    async def add_many(self, data: list[ModelT]) -> list[ModelT]:
+        """Add multiple `data` to the collection.
+
+        Two or more instances are inserted with a single executemany `INSERT ... RETURNING`.
+
+        Args:
+            data: Instances to be added to the collection.
+
+        Returns:
+            The added instances.
+        """
+        if len(data) < 2:
+            return [await self.add(datum) for datum in data]
+        with wrap_sqlalchemy_exception():
+            result = await self.session.execute(
+                insert(self.model_type).returning(self.model_type),
+                [self._get_insert_values(datum) for datum in data],
+            )
+            instances = cast("list[ModelT]", result.scalars().all())
+            self._expunge_all(instances)
+            return instances
+
+    async def bulk_copy(
+        self, rows: abc.Sequence[abc.Sequence[Any]], columns: abc.Sequence[str]
+    ) -> None:
+        """Load rows into the table of `model_type` with PostgreSQL's binary `COPY`.
+
+        `COPY` runs on the session's connection, so is part of the current transaction, but
+        skips the ORM entirely: column defaults set in Python, such as generated identifiers and
+        audit timestamps, are not applied and must be included in `rows`. Fewer rows than
+        `bulk_copy_threshold` are inserted via `add_many()`.
+
+        Args:
+            rows: Values for each row, in the same order as `columns`.
+            columns: Names of the columns that `rows` hold values for.
+        """
+        if len(rows) < self.bulk_copy_threshold:
+            await self.add_many([self.model_type(**dict(zip(columns, row))) for row in rows])
+            return
+        table = self.model_type.__table__  # type:ignore[attr-defined]
+        with wrap_sqlalchemy_exception():
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                table.name, records=rows, columns=list(columns), schema_name=table.schema
+            )
+
     async def delete(self, id_: Any) -> ModelT:
         """Delete instance identified by `id_`.
 
@@ -100,13 +254,39 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found identified by `id_`.
         """
+        self._get_cache.pop(id_, None)
         with wrap_sqlalchemy_exception():
+            if self._should_use_returning():
+                result = await self.session.execute(self._get_delete_returning([id_]))
+                instance = self.check_not_found(result.scalar_one_or_none())
+                self.session.expunge(instance)
+                return instance
             instance = await self.get(id_)
+            self._get_cache.pop(id_, None)
             await self.session.delete(instance)
             await self.session.flush()
             self.session.expunge(instance)
             return instance
 
+    async def delete_many(self, ids: list[Any]) -> list[ModelT]:
+        """Delete instances identified by `ids` with a single `DELETE ... RETURNING`.
+
+        Identifiers that don't exist in the collection are ignored.
+
+        Args:
+            ids: Identifiers of instances to be deleted.
+
+        Returns:
+            The deleted instances.
+        """
+        for id_ in ids:
+            self._get_cache.pop(id_, None)
+        with wrap_sqlalchemy_exception():
+            result = await self.session.execute(self._get_delete_returning(ids))
+            instances = cast("list[ModelT]", result.scalars().all())
+            self._expunge_all(instances)
+            return instances
+
     async def get(self, id_: Any) -> ModelT:
         """Get instance identified by `id_`.
 
@@ -119,11 +299,15 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found identified by `id_`.
         """
+        if self.cache_get and id_ in self._get_cache:
+            return self._get_cache[id_]
         with wrap_sqlalchemy_exception():
             self._filter_select_by_kwargs(**{self.id_attribute: id_})
             instance = (await self._execute()).scalar_one_or_none()
             instance = self.check_not_found(instance)
             self.session.expunge(instance)
+            if self.cache_get:
+                self._get_cache[id_] = instance
             return instance
 
     async def list(self, *filters: FilterTypes, **kwargs: Any) -> list[ModelT]:
@@ -136,25 +320,43 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Returns:
             The list of instances, after filtering applied.
         """
-        for filter_ in filters:
-            match filter_:
-                case LimitOffset(limit, offset):
-                    self._apply_limit_offset_pagination(limit, offset)
-                case BeforeAfter(field_name, before, after):
-                    self._filter_on_datetime_field(field_name, before, after)
-                case CollectionFilter(field_name, values):
-                    self._filter_in_collection(field_name, values)
-                case _:
-                    raise StarliteSaqlalchemyError(f"Unexpected filter: {filter}")
-        self._filter_select_by_kwargs(**kwargs)
+        self._apply_filters(*filters, **kwargs)
 
         with wrap_sqlalchemy_exception():
+            if self.list_yield_per is not None:
+                return await self._list_streamed(self.list_yield_per)
             result = await self._execute()
-            instances = list(result.scalars())
-            for instance in instances:
-                self.session.expunge(instance)
+            instances = cast("list[ModelT]", result.scalars().all())
+            self._expunge_all(instances)
             return instances
 
+    async def iter_list(self, *filters: FilterTypes, **kwargs: Any) -> AsyncIterator[ModelT]:
+        """Iterate over instances, optionally filtered, as they are read from the database.
+
+        Rows are streamed from a server-side cursor in batches of `iter_list_yield_per`, and each
+        batch is expunged from the session before it is yielded. The cursor is closed when the
+        iterator is exhausted or closed, so consumers that stop early should `aclose()` it.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Yields:
+            Instances, after filtering applied.
+        """
+        self._apply_filters(*filters, **kwargs)
+
+        with wrap_sqlalchemy_exception():
+            result = await self._stream(self.iter_list_yield_per)
+            try:
+                async for partition in result.scalars().partitions():
+                    self._expunge_all(partition)
+                    for instance in partition:
+                        yield instance
+            finally:
+                # release the server-side cursor if the consumer stops early
+                await result.close()
+
     async def update(self, data: ModelT) -> ModelT:
         """Update instance with the attribute values present on `data`.
 
@@ -168,10 +370,16 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found with same identifier as `data`.
         """
+        self._get_cache.pop(self.get_id_attribute_value(data), None)
         with wrap_sqlalchemy_exception():
+            if self._should_use_returning():
+                instance = self.check_not_found(await self._update_returning(data))
+                self.session.expunge(instance)
+                return instance
             id_ = self.get_id_attribute_value(data)
             # this will raise for not found, and will put the item in the session
             await self.get(id_)
+            self._get_cache.pop(id_, None)
             # this will merge the inbound data to the instance we just put in the session
             instance = await self._attach_to_session(data, strategy="merge")
             await self.session.flush()
@@ -179,6 +387,51 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             self.session.expunge(instance)
             return instance
 
+    async def update_many(self, data: list[ModelT]) -> list[ModelT]:
+        """Update instances with the attribute values present on each of `data`.
+
+        Rows are updated with a single executemany `UPDATE` by primary key, and the updated
+        instances are loaded back with one `SELECT`, rather than two round-trips per instance.
+
+        Args:
+            data: Instances that should each have a value for `self.id_attribute` that exists in
+                the collection.
+
+        Returns:
+            The updated instances, in the same order as `data`.
+
+        Raises:
+            RepositoryNotFoundException: If no instance found with same identifier as any of
+                `data`.
+        """
+        if not data:
+            return []
+        values = [self._get_insert_values(datum) for datum in data]
+        if hasattr(self.model_type, "updated"):
+            now = datetime.now()
+            for row in values:
+                row["updated"] = now
+        ids = [self.get_id_attribute_value(datum) for datum in data]
+        for id_ in ids:
+            self._get_cache.pop(id_, None)
+        with wrap_sqlalchemy_exception():
+            try:
+                await self.session.execute(update(self.model_type), values)
+            except StaleDataError as exc:
+                raise NotFoundError("No item found when one was expected") from exc
+            result = await self.session.execute(
+                select(self.model_type)
+                .where(self._get_column(self.id_attribute).in_(ids))
+                .execution_options(populate_existing=True)
+            )
+            instances = result.scalars().all()
+            self._expunge_all(instances)
+        # asyncpg doesn't report executemany row counts, so unmatched rows don't raise above
+        by_id = {self.get_id_attribute_value(instance): instance for instance in instances}
+        if len(by_id) != len(set(ids)):
+            raise NotFoundError("No item found when one was expected")
+        return [by_id[id_] for id_ in ids]
+
     async def upsert(self, data: ModelT) -> ModelT:
         """Update or create instance.
 
@@ -196,10 +449,14 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found with same identifier as `data`.
         """
+        self._get_cache.pop(self.get_id_attribute_value(data), None)
         with wrap_sqlalchemy_exception():
-            instance = await self._attach_to_session(data, strategy="merge")
-            await self.session.flush()
-            await self.session.refresh(instance)
+            if self._should_use_returning():
+                instance = await self._upsert_returning(data)
+            else:
+                instance = await self._attach_to_session(data, strategy="merge")
+                await self.session.flush()
+                await self.session.refresh(instance)
             self.session.expunge(instance)
             return instance
 
@@ -217,20 +474,130 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
     async def check_health(cls, session: AsyncSession) -> bool:
         """Perform a health check on the database.
 
+        If redis is installed, a successful check is cached for
+        `settings.db.HEALTH_CHECK_CACHE_EXPIRATION` seconds so that frequent probes don't all
+        reach the database. If redis can't be reached, the database is checked directly.
+
         Args:
             session: through which we runa check statement
 
         Returns:
             `True` if healthy.
         """
+        expiration = settings.db.HEALTH_CHECK_CACHE_EXPIRATION
+        if not (constants.IS_REDIS_INSTALLED and expiration):
+            return await cls._select_one(session)
+
+        # pylint: disable=import-outside-toplevel
+        from redis.exceptions import RedisError
+
+        from starlite_saqlalchemy import redis
+
+        key = f"{settings.app.slug}:health:db"
+        try:
+            if await redis.client.get(key) == b"1":
+                return True
+        except RedisError:
+            return await cls._select_one(session)
+        healthy = await cls._select_one(session)
+        if healthy:
+            with suppress(RedisError):
+                await redis.client.set(key, b"1", ex=expiration)
+        return healthy
+
+    @staticmethod
+    async def _select_one(session: AsyncSession) -> bool:
         return (  # type:ignore[no-any-return]  # pragma: no cover
             await session.execute(text("SELECT 1"))
         ).scalar_one() == 1
 
     # the following is all sqlalchemy implementation detail, and shouldn't be directly accessed
 
+    @classmethod
+    def _get_default_select(cls) -> Select[tuple[ModelT]]:
+        """Return `select(model_type)`, shared by instances as statements are immutable."""
+        if cls._default_select is None:
+            cls._default_select = select(cls.model_type)
+        return cls._default_select
+
+    @classmethod
+    def _get_kwargs_select(cls, keys: frozenset[str]) -> Select[tuple[ModelT]]:
+        """Return the default select filtered on a bound parameter for each of `keys`.
+
+        Built once per repository type and set of keys, so equality filters such as those of
+        `get()` reuse the same statement whatever the values filtered on.
+        """
+        try:
+            return cls._kwargs_selects[keys]
+        except KeyError:
+            select_ = cls._get_default_select()
+            for key in sorted(keys):
+                select_ = select_.where(cls._get_column(key) == bindparam(key))
+            cls._kwargs_selects[keys] = select_
+            return select_
+
+    @classmethod
+    def _get_column(cls, name: str) -> InstrumentedAttribute[Any]:
+        """Resolve the attribute named `name` on `model_type`, once per
+        repository type.
+
+        Args:
+            name: Name of the mapped attribute.
+
+        Returns:
+            The instrumented attribute for use in query expressions.
+        """
+        try:
+            return cls._columns[name]
+        except KeyError:
+            column = cls._columns[name] = getattr(cls.model_type, name)
+            return column
+
+    @classmethod
+    def _is_column_attribute(cls, name: str) -> bool:
+        """Return `True` if the attribute named `name` maps a column, rather than e.g., a
+        relationship."""
+        return isinstance(getattr(cls._get_column(name), "property", None), ColumnProperty)
+
+    def _apply_filters(self, *filters: FilterTypes, **kwargs: Any) -> None:
+        for filter_ in filters:
+            try:
+                handler, field_names = self._filter_dispatch[type(filter_)]
+            except KeyError:
+                handler, field_names = self._get_filter_dispatch(filter_)
+            getattr(self, handler)(*(getattr(filter_, name) for name in field_names))
+        self._filter_select_by_kwargs(**kwargs)
+
+    @classmethod
+    def _get_filter_dispatch(cls, filter_: FilterTypes) -> tuple[str, tuple[str, ...]]:
+        """Resolve the handler of a filter, or filter subclass, from its MRO, once per filter
+        type.
+
+        Args:
+            filter_: The filter to resolve.
+
+        Returns:
+            Name of the handler method, and the names of the fields of the handled filter type,
+            declared in the same order as the handler parameters.
+        """
+        filter_type = type(filter_)
+        for base in filter_type.__mro__[:-1]:
+            if base in cls._filter_handlers:
+                dispatch = cls._filter_handlers[base], tuple(field.name for field in fields(base))
+                cls._filter_dispatch[filter_type] = dispatch
+                return dispatch
+        raise StarliteSaqlalchemyError(f"Unexpected filter: {filter_}")
+
+    def _apply_keyset_pagination(self, field_name: str, after: Any | None, limit: int) -> None:
+        field = self._get_column(field_name)
+        if after is not None:
+            self._select = self._select.where(field > after)
+        self._select = self._select.order_by(field).limit(limit)
+
     def _apply_limit_offset_pagination(self, limit: int, offset: int) -> None:
-        self._select = self._select.limit(limit).offset(offset)
+        self._select = self._select.limit(limit)
+        if offset:
+            self._select = self._select.offset(offset)
 
     async def _attach_to_session(
         self, model: ModelT, strategy: Literal["add", "merge"] = "add"
@@ -256,23 +623,166 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             case _:
                 raise ValueError("Unexpected value for `strategy`, must be `'add'` or `'merge'`")
 
+    def _expunge_all(self, instances: abc.Sequence[ModelT]) -> None:
+        if self.owns_session or self._session_holds_only(instances):
+            self.session.expunge_all()
+            return
+        for instance in instances:
+            self.session.expunge(instance)
+
+    def _session_holds_only(self, instances: abc.Sequence[ModelT]) -> bool:
+        # every instance is in the identity map, so if the sizes match there's nothing else there
+        return not self.session.new and len(self.session.identity_map) == len(
+            {id(instance) for instance in instances}
+        )
+
+    def _get_insert_values(self, data: ModelT) -> dict[str, Any]:
+        """Collect the column values set on `data` for an `INSERT` statement.
+
+        Args:
+            data: Transient instance to be inserted.
+
+        Returns:
+            Column values keyed by attribute name.
+        """
+        state = inspect(data)
+        values = {}
+        for attr in state.mapper.column_attrs:
+            if attr.key not in state.dict:
+                continue
+            value = state.dict[attr.key]
+            # leave unset identities to the column default
+            if value is None and attr.key == self.id_attribute:
+                continue
+            values[attr.key] = value
+        return values
+
+    def _get_delete_returning(self, ids: abc.Collection[Any]) -> Delete:
+        return (
+            delete(self.model_type)
+            .where(self._get_column(self.id_attribute).in_(ids))
+            .returning(self.model_type)
+        )
+
+    async def _insert_returning(self, data: ModelT) -> ModelT:
+        """Insert the column values set on `data` and load the row back in one round-trip.
+
+        Args:
+            data: Transient instance to be inserted.
+
+        Returns:
+            Instance created from the `RETURNING` clause, attached to the session.
+        """
+        result = await self.session.execute(
+            insert(self.model_type)
+            .values(**self._get_insert_values(data))
+            .returning(self.model_type)
+        )
+        return result.scalar_one()  # type:ignore[no-any-return]
+
+    async def _update_returning(self, data: ModelT) -> ModelT | None:
+        """Update the row identified by `data` and load it back in one round-trip.
+
+        Args:
+            data: Instance with the identifier and values of the row to be updated.
+
+        Returns:
+            Instance created from the `RETURNING` clause, attached to the session, or `None` if
+            no row has the identifier.
+        """
+        values = self._get_insert_values(data)
+        id_ = values.pop(self.id_attribute, None)
+        if hasattr(self.model_type, "updated"):
+            values["updated"] = datetime.now()
+        id_column = self._get_column(self.id_attribute)
+        result = await self.session.execute(
+            update(self.model_type)
+            .where(id_column == id_)
+            # an empty `SET` is invalid, so fall back to a no-op assignment to still return the row
+            .values(values or {self.id_attribute: id_column})
+            .returning(self.model_type)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()  # type:ignore[no-any-return]
+
+    async def _upsert_returning(self, data: ModelT) -> ModelT:
+        """Insert or update the row for `data` and load it back in one round-trip.
+
+        Args:
+            data: Instance to be inserted, or that identifies the row to be updated.
+
+        Returns:
+            Instance created from the `RETURNING` clause, attached to the session.
+        """
+        values = self._get_insert_values(data)
+        if hasattr(self.model_type, "updated"):
+            values["updated"] = datetime.now()
+        statement = pg_insert(self.model_type).values(**values)
+        id_column = self._get_column(self.id_attribute)
+        # an empty `SET` is invalid, so fall back to a no-op assignment to still return the row
+        set_ = {key: statement.excluded[key] for key in values if key != self.id_attribute} or {
+            self.id_attribute: id_column
+        }
+        result = await self.session.execute(
+            statement.on_conflict_do_update(index_elements=[id_column], set_=set_)
+            .returning(self.model_type)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()  # type:ignore[no-any-return]
+
+    def _should_use_returning(self) -> bool:
+        return self.use_returning and self.session.get_bind().dialect.name == "postgresql"
+
     async def _execute(self) -> Result[tuple[ModelT, ...]]:
-        return await self.session.execute(self._select)
+        return await self.session.execute(self._select, self._params)
+
+    async def _stream(self, yield_per: int) -> AsyncResult[tuple[ModelT, ...]]:
+        return await self.session.stream(
+            self._select.execution_options(yield_per=yield_per), self._params
+        )
+
+    async def _list_streamed(self, yield_per: int) -> list[ModelT]:
+        instances: list[ModelT] = []
+        result = await self._stream(yield_per)
+        try:
+            async for partition in result.scalars().partitions():
+                self._expunge_all(partition)
+                instances.extend(partition)
+        finally:
+            await result.close()
+        return instances
 
     def _filter_in_collection(self, field_name: str, values: abc.Collection[Any]) -> None:
         if not values:
             return
-        self._select = self._select.where(getattr(self.model_type, field_name).in_(values))
+        self._select = self._select.where(self._get_column(field_name).in_(values))
 
     def _filter_on_datetime_field(
         self, field_name: str, before: datetime | None, after: datetime | None
     ) -> None:
-        field = getattr(self.model_type, field_name)
+        field = self._get_column(field_name)
+        criteria = []
         if before is not None:
-            self._select = self._select.where(field < before)
+            criteria.append(field < before)
         if after is not None:
-            self._select = self._select.where(field > before)
+            criteria.append(field > after)
+        if criteria:
+            self._select = self._select.where(*criteria)
 
     def _filter_select_by_kwargs(self, **kwargs: Any) -> None:
-        for key, val in kwargs.items():
-            self._select = self._select.where(getattr(self.model_type, key) == val)
+        # `== None` renders `IS NULL` inline, but `= :param` when the value is bound, and
+        # relationships can only be compared to instances, not bound parameters
+        if (
+            kwargs
+            and not self._params
+            and self._select is self._default_select
+            and all(val is not None for val in kwargs.values())
+            and all(self._is_column_attribute(key) for key in kwargs)
+        ):
+            self._select = self._get_kwargs_select(frozenset(kwargs))
+            self._params = kwargs
+            return
+        if kwargs:
+            self._select = self._select.where(
+                *(self._get_column(key) == val for key, val in kwargs.items())
+            )
@@ -6,8 +6,9 @@ from typing import Any
 from starlite_saqlalchemy.repository.filters import (
     BeforeAfter,
     CollectionFilter,
+    Keyset,
     LimitOffset,
 )
 
-FilterTypes = BeforeAfter | CollectionFilter[Any] | LimitOffset
+FilterTypes = BeforeAfter | CollectionFilter[Any] | Keyset | LimitOffset
 """Aggregate type alias of the types supported for collection filtering."""
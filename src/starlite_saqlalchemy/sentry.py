@@ -3,10 +3,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, TypedDict, cast
 
-import sentry_sdk
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
-from sentry_sdk.integrations.starlite import StarliteIntegration
-
 from starlite_saqlalchemy import settings
 
 if TYPE_CHECKING:
@@ -37,7 +33,14 @@ def configure(traces_sampler: TracesSampler | None = None) -> None:
     """Configure sentry on app startup.
 
     See [SentrySettings][starlite_saqlalchemy.settings.SentrySettings].
+
+    `sentry_sdk` is imported here, so that it is only loaded by processes that configure it.
     """
+    # pylint: disable=import-outside-toplevel
+    import sentry_sdk
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+    from sentry_sdk.integrations.starlite import StarliteIntegration
+
     sentry_sdk.init(
         dsn=settings.sentry.DSN,
         environment=settings.app.ENVIRONMENT,
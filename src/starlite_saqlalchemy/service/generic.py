@@ -4,14 +4,13 @@ Service object is generic on the domain model type.
 """
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from starlite_saqlalchemy import constants
 from starlite_saqlalchemy.exceptions import NotFoundError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from contextlib import AbstractAsyncContextManager
 
 
 T = TypeVar("T")
@@ -21,6 +20,8 @@ ServiceT = TypeVar("ServiceT", bound="Service")
 class Service(Generic[T]):
     """Generic Service object."""
 
+    __slots__ = ()
+
     __id__: ClassVar[str] = "starlite_saqlalchemy.service.generic.Service"
 
     def __init_subclass__(cls, *_: Any, **__: Any) -> None:
@@ -30,9 +31,9 @@ class Service(Generic[T]):
         application instances, e.g., using something like `hash()` or
         `id()` won't work as those would be different on different
         instances of the running application. So we use the full import
-        path to the object.
+        path to the object, qualified so that nested classes of the same name don't collide.
         """
-        cls.__id__ = f"{cls.__module__}.{cls.__name__}"
+        cls.__id__ = f"{cls.__module__}.{cls.__qualname__}"
         # error: Argument of type "Type[Self@Service[T@Service]]" cannot be assigned to parameter
         #       "__value" of type "Type[Service[Any]]" in function "__setitem__"
         #   "Type[Service[T@Service]]" is incompatible with "Type[Service[Any]]"
@@ -53,6 +54,17 @@ class Service(Generic[T]):
         """
         return data
 
+    async def create_many(self, data: list[T]) -> list[T]:
+        """Create multiple instances of `T`.
+
+        Args:
+            data: Representations to be created.
+
+        Returns:
+            Representations of created instances.
+        """
+        return data
+
     async def list(self, **kwargs: Any) -> list[T]:
         """Return view of the collection of `T`.
 
@@ -76,6 +88,17 @@ class Service(Generic[T]):
         """
         return data
 
+    async def update_many(self, items: list[tuple[Any, T]]) -> list[T]:
+        """Update multiple existing instances of `T`.
+
+        Args:
+            items: Identifier of each item to be updated, with its representation.
+
+        Returns:
+            Updated representations.
+        """
+        return [data for _, data in items]
+
     async def upsert(self, id_: Any, data: T) -> T:
         """Create or update an instance of `T` with `data`.
 
@@ -110,12 +133,41 @@ class Service(Generic[T]):
         """
         raise NotFoundError
 
+    async def delete_many(self, ids: list[Any]) -> list[T]:
+        """Delete each `T` identified by `ids`.
+
+        Args:
+            ids: Identifiers of instances to be deleted.
+
+        Returns:
+            Representations of the deleted instances.
+        """
+        return []
+
     @classmethod
-    @contextlib.asynccontextmanager
-    async def new(cls: type[ServiceT]) -> AsyncIterator[ServiceT]:
+    def new(cls: type[ServiceT]) -> AbstractAsyncContextManager[ServiceT]:
         """Context manager that returns instance of service object.
 
         Returns:
             The service object instance.
         """
-        yield cls()
+        return _ServiceContext(cls)
+
+
+class _ServiceContext(Generic[ServiceT]):
+    """Context manager returned by `Service.new()`.
+
+    A plain class rather than `@contextlib.asynccontextmanager`, as the worker enters one for
+    every job.
+    """
+
+    __slots__ = ("service_type",)
+
+    def __init__(self, service_type: type[ServiceT]) -> None:
+        self.service_type = service_type
+
+    async def __aenter__(self) -> ServiceT:
+        return self.service_type()
+
+    async def __aexit__(self, *_: Any) -> None:
+        return None
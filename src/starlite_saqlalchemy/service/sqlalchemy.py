@@ -6,7 +6,6 @@ should be a SQLAlchemy model.
 
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from starlite_saqlalchemy.db import async_session_factory
@@ -15,7 +14,10 @@ from starlite_saqlalchemy.repository.sqlalchemy import ModelT
 from .generic import Service
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from contextlib import AbstractAsyncContextManager
+    from types import TracebackType
+
+    from sqlalchemy.ext.asyncio import AsyncSession
 
     from starlite_saqlalchemy.repository.abc import AbstractRepository
     from starlite_saqlalchemy.repository.types import FilterTypes
@@ -27,9 +29,10 @@ RepoServiceT = TypeVar("RepoServiceT", bound="RepositoryService")
 class RepositoryService(Service[ModelT], Generic[ModelT]):
     """Service object that operates on a repository object."""
 
-    __id__ = "starlite_saqlalchemy.service.sqlalchemy.RepositoryService"
+    __slots__ = ("repository",)
 
-    repository_type: type[AbstractRepository[ModelT]]
+    # class var, but `ClassVar` can't be generic
+    repository_type: type[AbstractRepository[ModelT]]  # pylint: disable=declare-non-slot
 
     def __init__(self, **repo_kwargs: Any) -> None:
         """Configure the service object.
@@ -50,6 +53,17 @@ class RepositoryService(Service[ModelT], Generic[ModelT]):
         """
         return await self.repository.add(data)
 
+    async def create_many(self, data: list[ModelT]) -> list[ModelT]:
+        """Wrap repository bulk instance creation.
+
+        Args:
+            data: Representations to be created.
+
+        Returns:
+            Representations of created instances.
+        """
+        return await self.repository.add_many(data)
+
     async def list(self, *filters: FilterTypes, **kwargs: Any) -> list[ModelT]:
         """Wrap repository scalars operation.
 
@@ -75,6 +89,19 @@ class RepositoryService(Service[ModelT], Generic[ModelT]):
         self.repository.set_id_attribute_value(id_, data)
         return await self.repository.update(data)
 
+    async def update_many(self, items: list[tuple[Any, ModelT]]) -> list[ModelT]:
+        """Wrap repository bulk update operation.
+
+        Args:
+            items: Identifier of each item to be updated, with its representation.
+
+        Returns:
+            Updated representations.
+        """
+        for id_, data in items:
+            self.repository.set_id_attribute_value(id_, data)
+        return await self.repository.update_many([data for _, data in items])
+
     async def upsert(self, id_: Any, data: ModelT) -> ModelT:
         """Wrap repository upsert operation.
 
@@ -110,9 +137,19 @@ class RepositoryService(Service[ModelT], Generic[ModelT]):
         """
         return await self.repository.delete(id_)
 
+    async def delete_many(self, ids: list[Any]) -> list[ModelT]:
+        """Wrap repository bulk delete operation.
+
+        Args:
+            ids: Identifiers of instances to be deleted.
+
+        Returns:
+            Representations of the deleted instances.
+        """
+        return await self.repository.delete_many(ids)
+
     @classmethod
-    @contextlib.asynccontextmanager
-    async def new(cls: type[RepoServiceT]) -> AsyncIterator[RepoServiceT]:
+    def new(cls: type[RepoServiceT]) -> AbstractAsyncContextManager[RepoServiceT]:
         """Context manager that returns instance of service object.
 
         Handles construction of the database session.
@@ -120,5 +157,37 @@ class RepositoryService(Service[ModelT], Generic[ModelT]):
         Returns:
             The service object instance.
         """
-        async with async_session_factory() as session:
-            yield cls(session=session)
+        return _RepositoryServiceContext(cls)
+
+
+class _RepositoryServiceContext(Generic[RepoServiceT]):
+    """Context manager returned by `RepositoryService.new()`.
+
+    Opens a session for the service on enter, and closes it on exit.
+    """
+
+    __slots__ = ("service_type", "session")
+
+    def __init__(self, service_type: type[RepoServiceT]) -> None:
+        self.service_type = service_type
+        self.session: AsyncSession | None = None
+
+    async def __aenter__(self) -> RepoServiceT:
+        self.session = session = async_session_factory()
+        try:
+            return self.service_type(session=session)
+        except BaseException:
+            # `__aexit__()` isn't called if `__aenter__()` raises
+            self.session = None
+            await session.close()
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.session is not None:
+            await self.session.__aexit__(exc_type, exc, traceback)
+            self.session = None
@@ -1,10 +1,9 @@
 """Database connectivity and transaction management for the application."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from starlite.plugins.sql_alchemy import SQLAlchemyConfig, SQLAlchemyPlugin
 from starlite.plugins.sql_alchemy.config import (
     SESSION_SCOPE_KEY,
@@ -21,6 +20,8 @@ if TYPE_CHECKING:
 
 __all__ = ["SQLAlchemyHealthCheck", "config", "plugin"]
 
+_PING_STATEMENT = text("SELECT 1")
+
 
 async def before_send_handler(message: Message, _: State, scope: Scope) -> None:
     """Inspect status of response and commit, or rolls back.
@@ -30,17 +31,22 @@ async def before_send_handler(message: Message, _: State, scope: Scope) -> None:
         _:
         scope: ASGI scope
     """
-    session = cast("AsyncSession | None", scope.get(SESSION_SCOPE_KEY))
+    message_type = message["type"]
+    if message_type != "http.response.start" and message_type not in SESSION_TERMINUS_ASGI_EVENTS:
+        return
+    session: AsyncSession | None = scope.get(SESSION_SCOPE_KEY)  # type:ignore[assignment]
+    if session is None:
+        return
     try:
-        if session is not None and message["type"] == "http.response.start":
-            if 200 <= message["status"] < 300:
+        if message_type == "http.response.start":
+            if 200 <= message["status"] < 300:  # type:ignore[typeddict-item]
                 await session.commit()
             else:
                 await session.rollback()
     finally:
-        if session is not None and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
+        if message_type in SESSION_TERMINUS_ASGI_EVENTS:
             await session.close()
-            del scope[SESSION_SCOPE_KEY]  # type:ignore[misc]
+            scope.pop(SESSION_SCOPE_KEY, None)  # type:ignore[misc]
 
 
 class SQLAlchemyHealthCheck(AbstractHealthCheck):
@@ -49,11 +55,11 @@ class SQLAlchemyHealthCheck(AbstractHealthCheck):
     name: str = "db"
 
     def __init__(self) -> None:
-        """Health check with database check."""
-        self.engine = create_async_engine(
-            settings.db.URL, logging_name="starlite_saqlalchemy.health"
-        )
-        self.session_maker = async_sessionmaker(bind=self.engine)
+        """Health check with database check.
+
+        Checks out connections from the application's pool, rather than opening new ones.
+        """
+        self.engine = db.engine
 
     async def ready(self) -> bool:
         """Perform a health check on the database.
@@ -61,10 +67,8 @@ class SQLAlchemyHealthCheck(AbstractHealthCheck):
         Returns:
             `True` if healthy.
         """
-        async with self.session_maker() as session:  # pragma: no cover
-            return (  # type:ignore[no-any-return]
-                await session.execute(text("SELECT 1"))
-            ).scalar_one() == 1
+        async with self.engine.connect() as conn:  # pragma: no cover
+            return await conn.scalar(_PING_STATEMENT) == 1  # type:ignore[no-any-return]
 
 
 config = SQLAlchemyConfig(
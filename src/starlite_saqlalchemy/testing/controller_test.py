@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 class ControllerTest:
     """Standard controller testing utility."""
 
+    # pylint:disable=too-many-instance-attributes
+
     def __init__(
         self,
         client: TestClient,
@@ -48,6 +50,7 @@ class ControllerTest:
         self.base_path = base_path
         self.collection = collection
         self.raw_collection = raw_collection
+        self._raw_by_id = {item["id"]: item for item in raw_collection}
         self.service_type = service_type
         self.monkeypatch = monkeypatch
         self.collection_filters = collection_filters
@@ -56,7 +59,7 @@ class ControllerTest:
         return random.choice(self.collection)
 
     def _get_raw_for_member(self, member: Any) -> dict[str, Any]:
-        return [item for item in self.raw_collection if item["id"] == str(member.id)][0]
+        return self._raw_by_id[str(member.id)]
 
     def test_get_collection(self, with_filters: bool = False) -> None:
         """Test collection endpoint get request."""
@@ -83,10 +83,9 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found identified by `id_`.
         """
-        try:
-            return self._find_or_raise_not_found(id_)
-        finally:
-            del self.collection[id_]
+        instance = self._find_or_raise_not_found(id_)
+        del self.collection[id_]
+        return instance
 
     async def get(self, id_: Any) -> ModelT:
         """Get instance identified by `id_`.
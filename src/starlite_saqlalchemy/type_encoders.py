@@ -7,6 +7,47 @@ from asyncpg.pgproto import pgproto
 from starlite.utils.serialization import DEFAULT_TYPE_ENCODERS
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
     from starlite.types import TypeEncodersMap
 
+__all__ = ["serializer", "type_encoders_map"]
+
 type_encoders_map: TypeEncodersMap = {**DEFAULT_TYPE_ENCODERS, pgproto.UUID: str}
+
+
+def serializer(value: Any) -> Any:
+    """Serialize `value` with the encoder registered for its exact type.
+
+    Values of types without their own entry in `type_encoders_map`, e.g., subclasses, use the
+    encoder of the nearest base class in the type's MRO, which is resolved once per type.
+
+    Args:
+        value: A value that `msgspec` can't serialize natively.
+
+    Returns:
+        The serialized value.
+    """
+    type_ = type(value)
+    try:
+        encoder = type_encoders_map[type_]
+    except KeyError:
+        encoder = _get_inherited_encoder(type_)
+    return encoder(value)
+
+
+_inherited_encoders: dict[type[Any], Callable[[Any], Any]] = {}
+"""Encoders resolved from the MRO of types without an entry in `type_encoders_map`."""
+
+
+def _get_inherited_encoder(type_: type[Any]) -> Callable[[Any], Any]:
+    try:
+        return _inherited_encoders[type_]
+    except KeyError:
+        pass
+    for base in type_.__mro__[1:-1]:
+        if base in type_encoders_map:
+            encoder = _inherited_encoders[type_] = type_encoders_map[base]
+            return encoder
+    raise TypeError(f"Unsupported type: {type_!r}")
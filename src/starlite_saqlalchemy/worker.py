@@ -3,19 +3,16 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-import inspect
 import logging
-from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import msgspec
 import saq
-from starlite.utils.serialization import default_serializer
 
 from starlite_saqlalchemy import constants, redis, settings, type_encoders, utils
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Collection
+    from collections.abc import Awaitable, Callable, Collection, Sequence
     from signal import Signals
 
     from saq.types import Context
@@ -30,14 +27,13 @@ __all__ = [
     "default_job_config_dict",
     "make_service_callback",
     "enqueue_background_task_for_service",
+    "enqueue_background_tasks_for_service",
     "queue",
 ]
 
 logger = logging.getLogger(__name__)
 
-encoder = msgspec.json.Encoder(
-    enc_hook=partial(default_serializer, type_encoders=type_encoders.type_encoders_map)
-)
+encoder = msgspec.json.Encoder(enc_hook=type_encoders.serializer)
 
 
 class Queue(saq.Queue):
@@ -169,13 +165,21 @@ async def make_service_callback(
         service_type_id: Value of `__id__` class var on service type.
         service_method_name: Method to be called on the service object.
         **kwargs: Unpacked into the service method call as keyword arguments.
+
+    Raises:
+        ValueError: If `service_method_name` names a private attribute of the service.
     """
+    if service_method_name.startswith("_"):
+        raise ValueError(f"Service method '{service_method_name}' is not public")
     service_type = constants.SERVICE_OBJECT_IDENTITY_MAP[service_type_id]
     async with service_type.new() as service_object:
         method = getattr(service_object, service_method_name)
         await method(**kwargs)
 
 
+_MAKE_SERVICE_CALLBACK_NAME = make_service_callback.__qualname__
+
+
 async def enqueue_background_task_for_service(
     service_obj: Service, method_name: str, job_config: JobConfig | None = None, **kwargs: Any
 ) -> None:
@@ -187,21 +191,52 @@ async def enqueue_background_task_for_service(
         job_config: Configuration object to control the job that is enqueued.
         **kwargs: Arguments to be passed to the method when called. Must be JSON serializable.
     """
-    module = inspect.getmodule(service_obj)
-    if module is None:  # pragma: no cover
-        logger.warning("Callback not enqueued, no module resolved for %s", service_obj)
-        return
-    job_config_dict: dict[str, Any]
+    job = _make_service_job(service_obj, method_name, _get_job_config_dict(job_config), kwargs)
+    await queue.enqueue(job)
+
+
+async def enqueue_background_tasks_for_service(
+    service_obj: Service,
+    method_name: str,
+    iter_kwargs: Sequence[dict[str, Any]],
+    job_config: JobConfig | None = None,
+) -> None:
+    """Enqueue an async callback for each set of arguments in `iter_kwargs`.
+
+    The jobs are enqueued concurrently, so enqueueing many callbacks takes about as long as
+    enqueueing one, rather than one round-trip to redis after another.
+
+    Args:
+        service_obj: The Service instance that is requesting the callbacks.
+        method_name: Method on the service object that should be called by the async worker.
+        iter_kwargs: Arguments to be passed to the method for each call. Must be JSON
+            serializable.
+        job_config: Configuration object to control the jobs that are enqueued.
+    """
+    job_config_dict = _get_job_config_dict(job_config)
+    await asyncio.gather(
+        *(
+            queue.enqueue(_make_service_job(service_obj, method_name, job_config_dict, kwargs))
+            for kwargs in iter_kwargs
+        )
+    )
+
+
+def _get_job_config_dict(job_config: JobConfig | None) -> dict[str, Any]:
     if job_config is None:
-        job_config_dict = default_job_config_dict
-    else:
-        job_config_dict = utils.dataclass_as_dict_shallow(job_config, exclude_none=True)
-
-    kwargs["service_type_id"] = service_obj.__id__
-    kwargs["service_method_name"] = method_name
-    job = saq.Job(
-        function=make_service_callback.__qualname__,
-        kwargs=kwargs,
+        return default_job_config_dict
+    return utils.dataclass_as_dict_shallow(job_config, exclude_none=True)
+
+
+def _make_service_job(
+    service_obj: Service, method_name: str, job_config_dict: dict[str, Any], kwargs: dict[str, Any]
+) -> saq.Job:
+    return saq.Job(
+        function=_MAKE_SERVICE_CALLBACK_NAME,
+        kwargs={
+            **kwargs,
+            "service_type_id": service_obj.__id__,
+            "service_method_name": method_name,
+        },
         **job_config_dict,
     )
-    await queue.enqueue(job)
@@ -195,7 +195,7 @@ def _patch_db(app: Starlite, engine: AsyncEngine, monkeypatch: pytest.MonkeyPatc
     session_maker = async_sessionmaker(bind=engine)
     monkeypatch.setitem(app.state, sqlalchemy_plugin.config.engine_app_state_key, engine)
     sqla_health_check = SQLAlchemyHealthCheck()
-    monkeypatch.setattr(sqla_health_check, "session_maker", session_maker)
+    monkeypatch.setattr(sqla_health_check, "engine", engine)
     monkeypatch.setattr(HealthController, "health_checks", [AppHealthCheck(), sqla_health_check])
     monkeypatch.setitem(
         app.state,
@@ -63,6 +63,19 @@ async def test_make_service_callback_raises_runtime_error(
         )
 
 
+async def test_make_service_callback_rejects_private_method(
+    raw_authors: list[dict[str, Any]]
+) -> None:
+    """Tests that jobs can't call private attributes of the service object."""
+    with pytest.raises(ValueError):
+        await worker.make_service_callback(
+            {},
+            service_type_id="tests.utils.domain.authors.Service",
+            service_method_name="__init__",
+            raw_obj=raw_authors[0],
+        )
+
+
 async def test_enqueue_service_callback(monkeypatch: MonkeyPatch) -> None:
     """Tests that job enqueued with desired arguments."""
     enqueue_mock = AsyncMock()
@@ -103,3 +116,27 @@ async def test_enqueue_service_callback_with_custom_job_config(monkeypatch: Monk
         "service_method_name": "receive_callback",
         "raw_obj": {"a": "b"},
     }
+
+
+async def test_enqueue_service_callbacks(monkeypatch: MonkeyPatch) -> None:
+    """Tests that a job is enqueued for each set of arguments."""
+    enqueue_mock = AsyncMock()
+    monkeypatch.setattr(worker.queue, "enqueue", enqueue_mock)
+    service_instance = service.Service[Any]()
+    await worker.enqueue_background_tasks_for_service(
+        service_instance,
+        "receive_callback",
+        [{"raw_obj": {"a": "b"}}, {"raw_obj": {"c": "d"}}],
+        job_config=worker.JobConfig(timeout=999),
+    )
+    assert enqueue_mock.call_count == 2
+    jobs = [call.args[0] for call in enqueue_mock.mock_calls]
+    assert all(isinstance(job, Job) and job.timeout == 999 for job in jobs)
+    assert [job.kwargs for job in jobs] == [
+        {
+            "service_type_id": "starlite_saqlalchemy.service.generic.Service",
+            "service_method_name": "receive_callback",
+            "raw_obj": raw_obj,
+        }
+        for raw_obj in ({"a": "b"}, {"c": "d"})
+    ]
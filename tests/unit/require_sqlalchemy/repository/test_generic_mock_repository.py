@@ -1,10 +1,16 @@
 # pylint: disable=wrong-import-position,wrong-import-order
 from __future__ import annotations
 
+from uuid import uuid4
+
 import pytest
 
 from starlite_saqlalchemy.db import orm
-from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
+from starlite_saqlalchemy.exceptions import (
+    ConflictError,
+    NotFoundError,
+    StarliteSaqlalchemyError,
+)
 from starlite_saqlalchemy.testing.generic_mock_repository import GenericMockRepository
 from tests.utils.domain.authors import Author
 from tests.utils.domain.books import Book
@@ -19,6 +25,39 @@ async def test_repo_raises_conflict_if_add_with_id(
         await author_repository.add(authors[0])
 
 
+async def test_add_many(author_repository: GenericMockRepository[Author]) -> None:
+    """Test mock repo adds each of multiple instances."""
+    new_authors = [Author(name="Author 1"), Author(name="Author 2")]
+    added = await author_repository.add_many(new_authors)
+    assert added == new_authors
+    assert all(author.id in author_repository.collection for author in added)
+
+
+async def test_delete_not_found(author_repository: GenericMockRepository[Author]) -> None:
+    """Test mock repo raises not found when deleting an identifier that doesn't exist."""
+    with pytest.raises(NotFoundError):
+        await author_repository.delete(uuid4())
+
+
+async def test_delete_many(
+    authors: list[Author], author_repository: GenericMockRepository[Author]
+) -> None:
+    """Test mock repo deletes instances that exist and ignores other identifiers."""
+    ids = [author.id for author in authors]
+    deleted = await author_repository.delete_many([*ids, uuid4()])
+    assert deleted == authors
+    assert not author_repository.collection
+
+
+async def test_update_many(
+    authors: list[Author], author_repository: GenericMockRepository[Author]
+) -> None:
+    """Test mock repo updates each of multiple instances."""
+    updates = [Author(id=author.id, name=f"name {i}") for i, author in enumerate(authors)]
+    updated = await author_repository.update_many(updates)
+    assert [author.name for author in updated] == ["name 0", "name 1"]
+
+
 def test_generic_mock_repository_parametrization() -> None:
     """Test that the mock repository handles multiple types."""
     author_repo = GenericMockRepository[Author]
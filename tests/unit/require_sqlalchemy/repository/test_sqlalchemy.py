@@ -2,26 +2,40 @@
 # pylint: disable=protected-access,redefined-outer-name
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, call
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError, InvalidRequestError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
-from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
+from starlite_saqlalchemy import settings
+from starlite_saqlalchemy.exceptions import (
+    ConflictError,
+    NotFoundError,
+    StarliteSaqlalchemyError,
+)
 from starlite_saqlalchemy.repository.filters import (
     BeforeAfter,
     CollectionFilter,
+    Keyset,
     LimitOffset,
 )
 from starlite_saqlalchemy.repository.sqlalchemy import (
     SQLAlchemyRepository,
     wrap_sqlalchemy_exception,
 )
+from starlite_saqlalchemy.testing import modify_settings
+from tests.utils import domain
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from pytest import MonkeyPatch
 
 
@@ -61,6 +75,99 @@ async def test_sqlalchemy_repo_add(mock_repo: SQLAlchemyRepository) -> None:
     mock_repo.session.commit.assert_not_called()
 
 
+async def test_sqlalchemy_repo_add_insert_returning(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test add operation when configured to use `INSERT ... RETURNING`."""
+    mock_instance = MagicMock()
+    insert_mock = AsyncMock(return_value=mock_instance)
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    mock_repo.session.get_bind.return_value.dialect.name = "postgresql"
+    monkeypatch.setattr(mock_repo, "_insert_returning", insert_mock)
+    data = MagicMock()
+    instance = await mock_repo.add(data)
+    assert instance is mock_instance
+    insert_mock.assert_called_once_with(data)
+    mock_repo.session.add.assert_not_called()
+    mock_repo.session.flush.assert_not_called()
+    mock_repo.session.refresh.assert_not_called()
+    mock_repo.session.expunge.assert_called_once_with(mock_instance)
+
+
+async def test_insert_returning_statement() -> None:
+    """Test the statement built for `INSERT ... RETURNING`."""
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock()
+    repo = domain.authors.Repository(session=session)
+    await repo._insert_returning(domain.authors.Author(name="Agatha", dob=date(1890, 9, 15)))
+    statement = session.execute.call_args.args[0]
+    assert statement.is_insert
+    assert statement._returning
+    assert set(statement.compile().params) == {"id", "name", "dob", "created", "updated"}
+    session.execute.return_value.scalar_one.assert_called_once()
+
+
+async def test_sqlalchemy_repo_add_many(mock_repo: SQLAlchemyRepository) -> None:
+    """Test add many operation uses a single executemany statement."""
+    mock_instances = [MagicMock(), MagicMock()]
+    mock_repo.session.execute.return_value = MagicMock()
+    mock_repo.session.execute.return_value.scalars.return_value.all.return_value = mock_instances
+    mock_repo._get_insert_values = MagicMock(side_effect=[{"a": 1}, {"a": 2}])
+    with patch("starlite_saqlalchemy.repository.sqlalchemy.insert") as insert_mock:
+        instances = await mock_repo.add_many([MagicMock(), MagicMock()])
+    assert instances == mock_instances
+    mock_repo.session.execute.assert_called_once_with(
+        insert_mock.return_value.returning.return_value, [{"a": 1}, {"a": 2}]
+    )
+    mock_repo.session.add.assert_not_called()
+    assert mock_repo.session.expunge.call_count == 2
+
+
+async def test_sqlalchemy_repo_add_many_single(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test add many operation falls back to `add()` for a single instance."""
+    add_mock = AsyncMock()
+    monkeypatch.setattr(mock_repo, "add", add_mock)
+    data = MagicMock()
+    assert await mock_repo.add_many([data]) == [add_mock.return_value]
+    add_mock.assert_called_once_with(data)
+    mock_repo.session.execute.assert_not_called()
+
+
+async def test_sqlalchemy_repo_bulk_copy(monkeypatch: MonkeyPatch) -> None:
+    """Test bulk copy sends rows over the session's raw asyncpg connection."""
+    session = AsyncMock(spec=AsyncSession)
+    connection = session.connection.return_value
+    raw_connection = connection.get_raw_connection.return_value
+    raw_connection.driver_connection = AsyncMock()
+    repo = domain.authors.Repository(session=session)
+    monkeypatch.setattr(repo, "bulk_copy_threshold", 2)
+    rows = [("Agatha", date(1890, 9, 15)), ("Leo", date(1828, 9, 9))]
+    await repo.bulk_copy(rows, ("name", "dob"))
+    raw_connection.driver_connection.copy_records_to_table.assert_called_once_with(
+        "author", records=rows, columns=["name", "dob"], schema_name=None
+    )
+
+
+async def test_sqlalchemy_repo_bulk_copy_below_threshold(monkeypatch: MonkeyPatch) -> None:
+    """Test bulk copy of few rows is delegated to `add_many()`."""
+    repo = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    add_many_mock = AsyncMock()
+    monkeypatch.setattr(repo, "add_many", add_many_mock)
+    await repo.bulk_copy([("Agatha", date(1890, 9, 15))], ("name", "dob"))
+    (authors,) = add_many_mock.call_args.args
+    assert [(author.name, author.dob) for author in authors] == [("Agatha", date(1890, 9, 15))]
+    repo.session.connection.assert_not_called()
+
+
+def test_get_insert_values_skips_unset_id() -> None:
+    """Test that the insert values leave identity generation to the column default."""
+    repo = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    author = domain.authors.Author(id=None, name="Agatha", dob=date(1890, 9, 15))
+    assert repo._get_insert_values(author) == {"name": "Agatha", "dob": date(1890, 9, 15)}
+
+
 async def test_sqlalchemy_repo_delete(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
@@ -90,13 +197,61 @@ async def test_sqlalchemy_repo_get_member(
     mock_repo.session.commit.assert_not_called()
 
 
+async def test_sqlalchemy_repo_get_cached(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test get operation only queries once per identifier when `cache_get` is set."""
+    mock_instance = MagicMock()
+    result_mock = MagicMock()
+    result_mock.scalar_one_or_none = MagicMock(return_value=mock_instance)
+    execute_mock = AsyncMock(return_value=result_mock)
+    monkeypatch.setattr(mock_repo, "_execute", execute_mock)
+    monkeypatch.setattr(mock_repo, "cache_get", True)
+    assert await mock_repo.get("instance-id") is mock_instance
+    assert await mock_repo.get("instance-id") is mock_instance
+    execute_mock.assert_called_once()
+
+
+async def test_sqlalchemy_repo_write_invalidates_get_cache(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test writes drop the cached instance for the identifier they write to."""
+    monkeypatch.setattr(mock_repo, "cache_get", True)
+    monkeypatch.setattr(mock_repo, "_attach_to_session", AsyncMock())
+    monkeypatch.setattr(mock_repo, "get", AsyncMock())
+    data = MagicMock(id="instance-id")
+    for operation in (mock_repo.update, mock_repo.upsert):
+        mock_repo._get_cache["instance-id"] = MagicMock()
+        await operation(data)
+        assert "instance-id" not in mock_repo._get_cache
+    mock_repo._get_cache["instance-id"] = MagicMock()
+    await mock_repo.delete("instance-id")
+    assert "instance-id" not in mock_repo._get_cache
+
+
+async def test_sqlalchemy_repo_delete_invalidates_get_cache(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test the instance loaded by delete isn't left in the get cache."""
+    result_mock = MagicMock()
+    result_mock.scalar_one_or_none = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr(mock_repo, "_execute", AsyncMock(return_value=result_mock))
+    monkeypatch.setattr(mock_repo, "cache_get", True)
+    await mock_repo.get("instance-id")
+    await mock_repo.delete("instance-id")
+    assert "instance-id" not in mock_repo._get_cache
+    result_mock.scalar_one_or_none.return_value = None
+    with pytest.raises(NotFoundError):
+        await mock_repo.get("instance-id")
+
+
 async def test_sqlalchemy_repo_list(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
     """Test expected method calls for list operation."""
     mock_instances = [MagicMock(), MagicMock()]
     result_mock = MagicMock()
-    result_mock.scalars = MagicMock(return_value=mock_instances)
+    result_mock.scalars.return_value.all.return_value = mock_instances
     execute_mock = AsyncMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
     instances = await mock_repo.list()
@@ -105,6 +260,135 @@ async def test_sqlalchemy_repo_list(
     mock_repo.session.commit.assert_not_called()
 
 
+async def test_sqlalchemy_repo_list_owns_session(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test list operation expunges all in one call if the repository owns the session."""
+    mock_instances = [MagicMock(), MagicMock()]
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = mock_instances
+    monkeypatch.setattr(mock_repo, "_execute", AsyncMock(return_value=result_mock))
+    monkeypatch.setattr(mock_repo, "owns_session", True)
+    instances = await mock_repo.list()
+    assert instances == mock_instances
+    mock_repo.session.expunge_all.assert_called_once()
+    mock_repo.session.expunge.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("new", "identity_map_size", "expunge_all"),
+    [
+        (set(), 2, True),
+        ({MagicMock()}, 2, False),
+        (set(), 3, False),
+    ],
+)
+async def test_sqlalchemy_repo_list_expunge_all_if_session_holds_only_results(
+    new: set[MagicMock],
+    identity_map_size: int,
+    expunge_all: bool,
+    mock_repo: SQLAlchemyRepository,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test list operation uses `expunge_all()` only if nothing else is in the session."""
+    mock_instances = [MagicMock(), MagicMock()]
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = mock_instances
+    monkeypatch.setattr(mock_repo, "_execute", AsyncMock(return_value=result_mock))
+    mock_repo.session.new = new
+    mock_repo.session.identity_map = [MagicMock()] * identity_map_size
+    await mock_repo.list()
+    assert mock_repo.session.expunge_all.called is expunge_all
+    assert mock_repo.session.expunge.call_count == (0 if expunge_all else 2)
+
+
+async def test_sqlalchemy_repo_list_streamed(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test list operation streams results when `list_yield_per` is set."""
+    partitions = [[MagicMock(), MagicMock()], [MagicMock()]]
+
+    async def _partitions() -> AsyncIterator[list[MagicMock]]:
+        for partition in partitions:
+            yield partition
+
+    result_mock = MagicMock(close=AsyncMock())
+    result_mock.scalars.return_value.partitions = _partitions
+    stream_mock = AsyncMock(return_value=result_mock)
+    monkeypatch.setattr(mock_repo, "_stream", stream_mock)
+    monkeypatch.setattr(mock_repo, "list_yield_per", 2)
+    instances = await mock_repo.list()
+    assert instances == [*partitions[0], *partitions[1]]
+    stream_mock.assert_called_once_with(2)
+    assert mock_repo.session.expunge.call_count == 3
+    result_mock.close.assert_awaited_once()
+
+
+async def test_sqlalchemy_repo_iter_list(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test iter_list operation yields streamed results batch by batch."""
+    partitions = [[MagicMock(), MagicMock()], [MagicMock()]]
+
+    async def _partitions() -> AsyncIterator[list[MagicMock]]:
+        for partition in partitions:
+            yield partition
+
+    result_mock = MagicMock(close=AsyncMock())
+    result_mock.scalars.return_value.partitions = _partitions
+    stream_mock = AsyncMock(return_value=result_mock)
+    monkeypatch.setattr(mock_repo, "_stream", stream_mock)
+    monkeypatch.setattr(mock_repo, "iter_list_yield_per", 2)
+    instances = [instance async for instance in mock_repo.iter_list()]
+    assert instances == [*partitions[0], *partitions[1]]
+    stream_mock.assert_called_once_with(2)
+    assert mock_repo.session.expunge.call_count == 3
+    result_mock.close.assert_awaited_once()
+
+
+async def test_sqlalchemy_repo_iter_list_closed_early(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that the streamed result is closed if iteration stops before it is exhausted."""
+
+    async def _partitions() -> AsyncIterator[list[MagicMock]]:
+        yield [MagicMock(), MagicMock()]
+        yield [MagicMock()]
+
+    result_mock = MagicMock(close=AsyncMock())
+    result_mock.scalars.return_value.partitions = _partitions
+    monkeypatch.setattr(mock_repo, "_stream", AsyncMock(return_value=result_mock))
+    iterator = mock_repo.iter_list()
+    async for _ in iterator:  # pragma: no branch
+        break
+    result_mock.close.assert_not_awaited()
+    await iterator.aclose()  # type:ignore[attr-defined]
+    result_mock.close.assert_awaited_once()
+
+
+async def test_sqlalchemy_repo_iter_list_filtered(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test iter_list operation applies filters before streaming."""
+    filter_mock = MagicMock()
+    monkeypatch.setattr(mock_repo, "_apply_filters", filter_mock)
+    monkeypatch.setattr(mock_repo, "_stream", AsyncMock(side_effect=SQLAlchemyError))
+    limit_offset = LimitOffset(limit=1, offset=0)
+    with pytest.raises(StarliteSaqlalchemyError):
+        async for _ in mock_repo.iter_list(limit_offset, a=1):
+            pass
+    filter_mock.assert_called_once_with(limit_offset, a=1)
+
+
+async def test_stream(mock_repo: SQLAlchemyRepository) -> None:
+    """Test the abstraction over `AsyncSession.stream()`"""
+    await mock_repo._stream(10)
+    mock_repo._select.execution_options.assert_called_once_with(yield_per=10)
+    mock_repo.session.stream.assert_called_once_with(
+        mock_repo._select.execution_options.return_value, {}
+    )
+
+
 async def test_sqlalchemy_repo_list_with_pagination(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
@@ -119,6 +403,33 @@ async def test_sqlalchemy_repo_list_with_pagination(
     mock_repo._select.limit().offset.assert_called_once_with(3)  # type:ignore[call-arg]
 
 
+async def test_sqlalchemy_repo_list_with_pagination_first_page(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test list operation doesn't add a redundant `OFFSET 0`."""
+    monkeypatch.setattr(mock_repo, "_execute", AsyncMock(return_value=MagicMock()))
+    mock_repo._select.limit.return_value = mock_repo._select
+    await mock_repo.list(LimitOffset(2, 0))
+    mock_repo._select.limit.assert_called_once_with(2)
+    mock_repo._select.offset.assert_not_called()
+
+
+def test_sqlalchemy_repo_keyset_pagination() -> None:
+    """Test keyset pagination filters on, orders by and limits the field."""
+    repo = domain.authors.Repository(session=AsyncMock())
+    repo._apply_filters(Keyset("name", "Agatha", 10))
+    compiled = repo._select.compile(dialect=postgresql.dialect())  # type:ignore[no-untyped-call]
+    assert "WHERE author.name > %(name_1)s ORDER BY author.name" in str(compiled)
+    assert compiled.params == {"name_1": "Agatha", "param_1": 10}
+
+
+def test_sqlalchemy_repo_keyset_pagination_first_page() -> None:
+    """Test keyset pagination of the first page doesn't filter on the field."""
+    repo = domain.authors.Repository(session=AsyncMock())
+    repo._apply_filters(Keyset("name", None, 10))
+    assert "WHERE" not in str(repo._select)
+
+
 async def test_sqlalchemy_repo_list_with_before_after_filter(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
@@ -132,8 +443,7 @@ async def test_sqlalchemy_repo_list_with_before_after_filter(
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
     mock_repo._select.where.return_value = mock_repo._select
     await mock_repo.list(BeforeAfter(field_name, datetime.max, datetime.min))
-    assert mock_repo._select.where.call_count == 2
-    assert mock_repo._select.where.has_calls([call("gt"), call("lt")])
+    mock_repo._select.where.assert_called_once_with("lt", "gt")
 
 
 async def test_sqlalchemy_repo_list_with_collection_filter(
@@ -151,6 +461,30 @@ async def test_sqlalchemy_repo_list_with_collection_filter(
     getattr(mock_repo.model_type, field_name).in_.assert_called_once_with(values)
 
 
+def test_sqlalchemy_repo_filter_subclass(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that subclasses of the filter types are applied by their base type's handler."""
+
+    @dataclass
+    class MyLimitOffset(LimitOffset):
+        """Subclass of a filter type that adds a field."""
+
+        label: str = "page"
+
+    handlers = dict(SQLAlchemyRepository._filter_handlers)
+    apply_mock = MagicMock()
+    monkeypatch.setattr(mock_repo, "_apply_limit_offset_pagination", apply_mock)
+    mock_repo._apply_filters(MyLimitOffset(2, 3))
+    apply_mock.assert_called_once_with(2, 3)
+    assert type(mock_repo)._filter_dispatch[MyLimitOffset] == (
+        "_apply_limit_offset_pagination",
+        ("limit", "offset"),
+    )
+    assert SQLAlchemyRepository._filter_handlers == handlers
+    assert SQLAlchemyRepository._filter_dispatch == {}
+
+
 async def test_sqlalchemy_repo_unknown_filter_type_raises(mock_repo: SQLAlchemyRepository) -> None:
     """Test that repo raises exception if list receives unknown filter type."""
     with pytest.raises(StarliteSaqlalchemyError):
@@ -190,6 +524,211 @@ async def test_sqlalchemy_repo_upsert(mock_repo: SQLAlchemyRepository) -> None:
     mock_repo.session.commit.assert_not_called()
 
 
+async def test_sqlalchemy_repo_update_many(mock_repo: SQLAlchemyRepository) -> None:
+    """Test update many operation uses one executemany `UPDATE` and one `SELECT`."""
+    mock_instances = [MagicMock(id=1), MagicMock(id=2)]
+    mock_repo.session.execute.return_value = MagicMock()
+    # rows come back in database order
+    mock_repo.session.execute.return_value.scalars.return_value.all.return_value = mock_instances[
+        ::-1
+    ]
+    mock_repo._get_insert_values = MagicMock(side_effect=[{"id": 1}, {"id": 2}])
+    with patch("starlite_saqlalchemy.repository.sqlalchemy.update") as update_mock, patch(
+        "starlite_saqlalchemy.repository.sqlalchemy.select"
+    ):
+        instances = await mock_repo.update_many([MagicMock(id=1), MagicMock(id=2)])
+    assert instances == mock_instances
+    assert mock_repo.session.execute.call_count == 2
+    assert mock_repo.session.execute.call_args_list[0].args == (
+        update_mock.return_value,
+        [{"id": 1, "updated": ANY}, {"id": 2, "updated": ANY}],
+    )
+    mock_repo.model_type.id.in_.assert_called_once_with([1, 2])
+    assert mock_repo.session.expunge.call_count == 2
+
+
+async def test_sqlalchemy_repo_update_many_empty(mock_repo: SQLAlchemyRepository) -> None:
+    """Test update many operation with no data doesn't touch the database."""
+    assert await mock_repo.update_many([]) == []
+    mock_repo.session.execute.assert_not_called()
+
+
+async def test_sqlalchemy_repo_update_many_not_found(mock_repo: SQLAlchemyRepository) -> None:
+    """Test update many operation raises not found if any row isn't matched.
+
+    The executemany `UPDATE` doesn't raise for unmatched rows on asyncpg, so they are only
+    missing from the `SELECT`.
+    """
+    mock_repo.session.execute.return_value = MagicMock()
+    mock_repo.session.execute.return_value.scalars.return_value.all.return_value = [MagicMock(id=1)]
+    mock_repo._get_insert_values = MagicMock(side_effect=[{"id": 1}, {"id": 2}])
+    with pytest.raises(NotFoundError), patch(
+        "starlite_saqlalchemy.repository.sqlalchemy.update"
+    ), patch("starlite_saqlalchemy.repository.sqlalchemy.select"):
+        await mock_repo.update_many([MagicMock(id=1), MagicMock(id=2)])
+
+
+async def test_sqlalchemy_repo_update_many_single_not_found(
+    mock_repo: SQLAlchemyRepository,
+) -> None:
+    """Test update many operation raises not found if a single row update isn't matched."""
+    mock_repo._get_insert_values = MagicMock(return_value={"id": 1})
+    mock_repo.session.execute.side_effect = StaleDataError
+    with pytest.raises(NotFoundError), patch("starlite_saqlalchemy.repository.sqlalchemy.update"):
+        await mock_repo.update_many([MagicMock(id=1)])
+
+
+async def test_sqlalchemy_repo_update_returning(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test update operation when configured to use `UPDATE ... RETURNING`."""
+    mock_instance = MagicMock()
+    update_mock = AsyncMock(return_value=mock_instance)
+    get_mock = AsyncMock()
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    monkeypatch.setattr(mock_repo, "_update_returning", update_mock)
+    monkeypatch.setattr(mock_repo, "get", get_mock)
+    mock_repo.session.get_bind.return_value.dialect.name = "postgresql"
+    data = MagicMock()
+    instance = await mock_repo.update(data)
+    assert instance is mock_instance
+    update_mock.assert_called_once_with(data)
+    get_mock.assert_not_called()
+    mock_repo.session.merge.assert_not_called()
+    mock_repo.session.flush.assert_not_called()
+    mock_repo.session.refresh.assert_not_called()
+    mock_repo.session.expunge.assert_called_once_with(mock_instance)
+
+
+async def test_sqlalchemy_repo_update_returning_not_found(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test update operation raises not found if `UPDATE ... RETURNING` returns no row."""
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    monkeypatch.setattr(mock_repo, "_update_returning", AsyncMock(return_value=None))
+    mock_repo.session.get_bind.return_value.dialect.name = "postgresql"
+    with pytest.raises(NotFoundError):
+        await mock_repo.update(MagicMock())
+
+
+async def test_update_returning_statement() -> None:
+    """Test the statement built for `UPDATE ... RETURNING`."""
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock()
+    repo = domain.authors.Repository(session=session)
+    await repo._update_returning(domain.authors.Author(id=uuid4(), name="Agatha"))
+    statement = session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE author SET name=%(name)s, updated=%(updated)s WHERE author.id =")
+    assert "RETURNING" in sql
+    assert statement.get_execution_options()["populate_existing"] is True
+    session.execute.return_value.scalar_one_or_none.assert_called_once()
+
+
+async def test_sqlalchemy_repo_delete_returning(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test delete operation when configured to use `DELETE ... RETURNING`."""
+    mock_instance = MagicMock()
+    get_mock = AsyncMock()
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    monkeypatch.setattr(mock_repo, "get", get_mock)
+    monkeypatch.setattr(mock_repo, "_get_delete_returning", MagicMock())
+    mock_repo.session.get_bind.return_value.dialect.name = "postgresql"
+    mock_repo.session.execute.return_value = MagicMock()
+    mock_repo.session.execute.return_value.scalar_one_or_none.return_value = mock_instance
+    instance = await mock_repo.delete("instance-id")
+    assert instance is mock_instance
+    mock_repo._get_delete_returning.assert_called_once_with(["instance-id"])
+    get_mock.assert_not_called()
+    mock_repo.session.delete.assert_not_called()
+    mock_repo.session.flush.assert_not_called()
+    mock_repo.session.expunge.assert_called_once_with(mock_instance)
+
+
+async def test_sqlalchemy_repo_delete_returning_not_found(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test delete operation raises not found if `DELETE ... RETURNING` returns no row."""
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    monkeypatch.setattr(mock_repo, "_get_delete_returning", MagicMock())
+    mock_repo.session.get_bind.return_value.dialect.name = "postgresql"
+    mock_repo.session.execute.return_value = MagicMock()
+    mock_repo.session.execute.return_value.scalar_one_or_none.return_value = None
+    with pytest.raises(NotFoundError):
+        await mock_repo.delete("instance-id")
+
+
+async def test_sqlalchemy_repo_delete_many(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test delete many operation uses a single `DELETE ... RETURNING` statement."""
+    mock_instances = [MagicMock(), MagicMock()]
+    monkeypatch.setattr(mock_repo, "_get_delete_returning", MagicMock())
+    mock_repo.session.execute.return_value = MagicMock()
+    mock_repo.session.execute.return_value.scalars.return_value.all.return_value = mock_instances
+    assert await mock_repo.delete_many([1, 2]) == mock_instances
+    mock_repo._get_delete_returning.assert_called_once_with([1, 2])
+    mock_repo.session.execute.assert_called_once_with(mock_repo._get_delete_returning.return_value)
+    assert mock_repo.session.expunge.call_count == 2
+
+
+def test_delete_returning_statement() -> None:
+    """Test the statement built for `DELETE ... RETURNING`."""
+    repo = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    statement = repo._get_delete_returning([uuid4(), uuid4()])
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("DELETE FROM author WHERE author.id IN (")
+    assert "RETURNING" in sql
+
+
+async def test_sqlalchemy_repo_upsert_returning(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test upsert operation when configured to use `INSERT ... ON CONFLICT ... RETURNING`."""
+    mock_instance = MagicMock()
+    upsert_mock = AsyncMock(return_value=mock_instance)
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    monkeypatch.setattr(mock_repo, "_upsert_returning", upsert_mock)
+    mock_repo.session.get_bind.return_value.dialect.name = "postgresql"
+    data = MagicMock()
+    instance = await mock_repo.upsert(data)
+    assert instance is mock_instance
+    upsert_mock.assert_called_once_with(data)
+    mock_repo.session.merge.assert_not_called()
+    mock_repo.session.refresh.assert_not_called()
+    mock_repo.session.expunge.assert_called_once_with(mock_instance)
+
+
+async def test_sqlalchemy_repo_use_returning_requires_postgresql(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that `use_returning` is ignored for other dialects."""
+    monkeypatch.setattr(mock_repo, "use_returning", True)
+    mock_repo.session.get_bind.return_value.dialect.name = "sqlite"
+    mock_repo.session.merge.return_value = MagicMock()
+    await mock_repo.upsert(MagicMock())
+    mock_repo.session.merge.assert_called_once()
+    mock_repo.session.refresh.assert_called_once()
+
+
+async def test_upsert_returning_statement() -> None:
+    """Test the statement built for `INSERT ... ON CONFLICT ... RETURNING`."""
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock()
+    repo = domain.authors.Repository(session=session)
+    await repo._upsert_returning(
+        domain.authors.Author(id=uuid4(), name="Agatha", dob=date(1890, 9, 15))
+    )
+    statement = session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO UPDATE SET" in sql
+    assert "name = excluded.name" in sql
+    assert "updated = excluded.updated" in sql
+    assert "created = " not in sql
+    assert statement.get_execution_options()["populate_existing"] is True
+
+
 async def test_attach_to_session_unexpected_strategy_raises_valueerror(
     mock_repo: SQLAlchemyRepository,
 ) -> None:
@@ -201,7 +740,7 @@ async def test_attach_to_session_unexpected_strategy_raises_valueerror(
 async def test_execute(mock_repo: SQLAlchemyRepository) -> None:
     """Simple test of the abstraction over `AsyncSession.execute()`"""
     await mock_repo._execute()
-    mock_repo.session.execute.assert_called_once_with(mock_repo._select)
+    mock_repo.session.execute.assert_called_once_with(mock_repo._select, {})
 
 
 def test_filter_in_collection_noop_if_collection_empty(mock_repo: SQLAlchemyRepository) -> None:
@@ -223,9 +762,23 @@ def test__filter_on_datetime_field(
 ) -> None:
     """Test through branches of _filter_on_datetime_field()"""
     field_mock = MagicMock()
-    field_mock.__gt__ = field_mock.__lt__ = lambda self, other: True
+    field_mock.__lt__ = lambda self, other: ("lt", other)
+    field_mock.__gt__ = lambda self, other: ("gt", other)
     mock_repo.model_type.updated = field_mock
+    select_ = mock_repo._select
     mock_repo._filter_on_datetime_field("updated", before, after)
+    expected = []
+    if before is not None:
+        expected.append(("lt", before))
+    if after is not None:
+        expected.append(("gt", after))
+    select_.where.assert_called_once_with(*expected)
+
+
+def test__filter_on_datetime_field_noop_without_bounds(mock_repo: SQLAlchemyRepository) -> None:
+    """Test that no criteria are added if neither bound is set."""
+    mock_repo._filter_on_datetime_field("updated", None, None)
+    mock_repo._select.where.assert_not_called()
 
 
 def test_filter_collection_by_kwargs(mock_repo: SQLAlchemyRepository) -> None:
@@ -244,3 +797,141 @@ def test_filter_collection_by_kwargs_raises_repository_exception_for_attribute_e
     )
     with pytest.raises(StarliteSaqlalchemyError):
         mock_repo.filter_collection_by_kwargs(a=1)
+
+
+def test_get_column_cached_per_repository_type(mock_repo: SQLAlchemyRepository) -> None:
+    """Test that column attributes are only resolved from the model once."""
+    column = mock_repo._get_column("name")
+    assert column is mock_repo.model_type.name
+    mock_repo.model_type.name = MagicMock()
+    assert mock_repo._get_column("name") is column
+    assert SQLAlchemyRepository._columns == {}
+
+
+def test_default_select_shared_by_instances() -> None:
+    """Test that the default select is built once per repository type."""
+    first = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    second = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    assert first._select is second._select
+    assert domain.books.Repository._get_default_select() is not first._select
+
+
+def test_filter_select_by_kwargs_reuses_bound_select() -> None:
+    """Test that equality filters on the default select reuse one statement per shape."""
+    first = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    second = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    first._filter_select_by_kwargs(id=1)
+    second._filter_select_by_kwargs(id=2)
+    assert first._select is second._select
+    assert (first._params, second._params) == ({"id": 1}, {"id": 2})
+    assert str(first._select).endswith("WHERE author.id = :id")
+
+
+def test_filter_select_by_kwargs_on_filtered_select() -> None:
+    """Test that equality filters on an already filtered select bind values directly."""
+    repo = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    repo._filter_select_by_kwargs(id=1)
+    repo._filter_select_by_kwargs(name="Agatha")
+    assert repo._params == {"id": 1}
+    assert repo._select.compile().params["name_1"] == "Agatha"
+
+
+def test_filter_select_by_kwargs_none_value_is_null() -> None:
+    """Test that filtering on `None` compiles to `IS NULL`, not a bound equality."""
+    repo = domain.authors.Repository(session=AsyncMock(spec=AsyncSession))
+    repo._filter_select_by_kwargs(dob=None)
+    assert repo._params == {}
+    assert str(repo._select.compile(dialect=postgresql.dialect())).endswith(
+        "WHERE author.dob IS NULL"
+    )
+
+
+def test_filter_select_by_kwargs_relationship() -> None:
+    """Test that filtering on a relationship compares to the instance inline."""
+    author = domain.authors.Author(id=uuid4(), name="Agatha Christie")
+    repo = domain.books.Repository(session=AsyncMock(spec=AsyncSession))
+    repo._filter_select_by_kwargs(author=author)
+    assert repo._params == {}
+    assert frozenset({"author"}) not in domain.books.Repository._kwargs_selects
+    assert str(repo._select).endswith("WHERE :param_1 = book.author_id")
+
+
+def test_filter_select_by_kwargs_single_where(mock_repo: SQLAlchemyRepository) -> None:
+    """Test that all equality filters on a custom select are added with one `where()`."""
+    select_ = mock_repo._select
+    mock_repo._filter_select_by_kwargs(a=1, b=2)
+    select_.where.assert_called_once()
+    assert len(select_.where.call_args.args) == 2
+
+
+def test_repository_instance_slots() -> None:
+    """Test that a slotted repository subclass has no instance `__dict__`."""
+
+    class Repo(SQLAlchemyRepository[MagicMock]):
+        """Repo declaring no extra instance state."""
+
+        __slots__ = ()
+        model_type = MagicMock()  # pyright:ignore[reportGeneralTypeIssues]
+
+    repo = Repo(session=AsyncMock(spec=AsyncSession), select_=MagicMock())
+    assert not hasattr(repo, "__dict__")
+
+
+async def test_check_health_cached(monkeypatch: MonkeyPatch) -> None:
+    """Test that a successful health check is cached in redis."""
+    from starlite_saqlalchemy import redis
+
+    client_mock = AsyncMock()
+    client_mock.get.return_value = None
+    select_one_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(redis, "client", client_mock)
+    monkeypatch.setattr(SQLAlchemyRepository, "_select_one", select_one_mock)
+    session = AsyncMock(spec=AsyncSession)
+    assert await SQLAlchemyRepository.check_health(session) is True
+    select_one_mock.assert_called_once_with(session)
+    client_mock.set.assert_called_once_with(
+        f"{settings.app.slug}:health:db", b"1", ex=settings.db.HEALTH_CHECK_CACHE_EXPIRATION
+    )
+    client_mock.get.return_value = b"1"
+    assert await SQLAlchemyRepository.check_health(session) is True
+    select_one_mock.assert_called_once()
+
+
+async def test_check_health_failure_not_cached(monkeypatch: MonkeyPatch) -> None:
+    """Test that a failed health check isn't cached."""
+    from starlite_saqlalchemy import redis
+
+    client_mock = AsyncMock()
+    client_mock.get.return_value = None
+    monkeypatch.setattr(redis, "client", client_mock)
+    monkeypatch.setattr(SQLAlchemyRepository, "_select_one", AsyncMock(return_value=False))
+    assert await SQLAlchemyRepository.check_health(AsyncMock(spec=AsyncSession)) is False
+    client_mock.set.assert_not_called()
+
+
+@pytest.mark.parametrize("failing_method", ["get", "set"])
+async def test_check_health_redis_error_falls_back_to_database(
+    failing_method: str, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that redis errors don't fail the database health check."""
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    from starlite_saqlalchemy import redis
+
+    client_mock = AsyncMock()
+    client_mock.get.return_value = None
+    getattr(client_mock, failing_method).side_effect = RedisConnectionError
+    select_one_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(redis, "client", client_mock)
+    monkeypatch.setattr(SQLAlchemyRepository, "_select_one", select_one_mock)
+    assert await SQLAlchemyRepository.check_health(AsyncMock(spec=AsyncSession)) is True
+    select_one_mock.assert_called_once()
+
+
+async def test_check_health_cache_disabled(monkeypatch: MonkeyPatch) -> None:
+    """Test that the health check goes straight to the database if caching disabled."""
+    select_one_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(SQLAlchemyRepository, "_select_one", select_one_mock)
+    with modify_settings((settings.db, {"HEALTH_CHECK_CACHE_EXPIRATION": 0})):
+        assert await SQLAlchemyRepository.check_health(AsyncMock(spec=AsyncSession)) is True
+    select_one_mock.assert_called_once()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from starlite_saqlalchemy import db
 
@@ -19,3 +20,23 @@ def test_serializer_raises_type_err() -> None:
     """Test _default() function raises ValueError."""
     with pytest.raises(TypeError):
         db._default(None)
+
+
+def test_jsonb_codec_round_trip() -> None:
+    """Test the jsonb codec adds, and strips, the PostgreSQL binary jsonb prefix."""
+    encoded = db._jsonb_encoder(b'{"a":1}')
+    assert encoded == b'\x01{"a":1}'
+    assert db._jsonb_decoder(encoded) == {"a": 1}
+
+
+def test_engine_pool() -> None:
+    """Test the engine uses the asyncio-compatible queue pool, configured from settings."""
+    assert isinstance(db.engine.pool, AsyncAdaptedQueuePool)
+    assert db.engine.pool._recycle == 300
+    assert db.engine.pool._pre_ping is False
+    assert db.engine.pool._pool.use_lifo is True
+
+
+def test_session_factory_does_not_expire_on_commit() -> None:
+    """Test instances remain loaded after the session commits."""
+    assert db.async_session_factory.kw["expire_on_commit"] is False
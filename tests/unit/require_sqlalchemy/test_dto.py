@@ -311,3 +311,11 @@ def test_dto_mapped_union_relationship() -> None:
     assert field.default is None
     assert issubclass(field.type_, BaseModel)
     assert "val" in field.type_.__fields__
+
+
+def test_dto_type_built_once_per_config() -> None:
+    """Test that subscripting with the same model and config returns the same type."""
+    read_dto = dto.FromMapped[Annotated[Author, "read"]]
+    assert dto.FromMapped[Annotated[Author, dto.config("read")]] is read_dto
+    assert dto.FromMapped[Annotated[Author, "write"]] is not read_dto
+    assert dto.FromMapped[Annotated[Author, dto.config("read", {"dob"})]] is not read_dto
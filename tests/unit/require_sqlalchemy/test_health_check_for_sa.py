@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock
 
 from starlite.status_codes import HTTP_200_OK
 
-from starlite_saqlalchemy import settings
+from starlite_saqlalchemy import db, settings
 from starlite_saqlalchemy.health import HealthController, HealthResource
 from starlite_saqlalchemy.sqlalchemy_plugin import SQLAlchemyHealthCheck
 
@@ -27,3 +27,8 @@ def test_health_check(client: "TestClient", monkeypatch: "MonkeyPatch") -> None:
     health = HealthResource(app=settings.app, health={health_check.name: True})
     assert resp.json() == health.dict()
     repo_health_mock.assert_called_once()
+
+
+def test_health_check_uses_application_engine() -> None:
+    """Test the health check uses the application's pooled engine."""
+    assert SQLAlchemyHealthCheck().engine is db.engine
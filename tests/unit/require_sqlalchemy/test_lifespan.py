@@ -0,0 +1,35 @@
+"""Tests for the database lifespan handlers."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from starlite_saqlalchemy import db, lifespan, settings
+
+if TYPE_CHECKING:
+    from pytest import LogCaptureFixture, MonkeyPatch
+
+
+async def test_warm_db_pool_closes_connections_if_one_fails(
+    caplog: LogCaptureFixture, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that a failed connection is logged, and those opened are returned to the pool."""
+    connections = [MagicMock(spec=AsyncConnection, close=AsyncMock()) for _ in range(2)]
+    outcomes: list[MagicMock | Exception] = [connections[0], OSError("refused"), connections[1]]
+
+    async def _connect() -> MagicMock:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(db, "engine", MagicMock(connect=_connect))
+    monkeypatch.setattr(settings.db, "POOL_PRE_WARM", 3)
+    monkeypatch.setattr(settings.db, "POOL_DISABLE", False)
+    await lifespan._warm_db_pool()
+    for connection in connections:
+        connection.close.assert_awaited_once()
+    assert "refused" in caplog.text
@@ -1,14 +1,17 @@
 """Tests for Service object patterns."""
 from __future__ import annotations
 
+import gc
 from datetime import date
 from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
-from starlite_saqlalchemy import service
+from starlite_saqlalchemy import constants, service
 from starlite_saqlalchemy.exceptions import NotFoundError
+from starlite_saqlalchemy.service.sqlalchemy import RepositoryService
 from tests.utils import domain
 
 if TYPE_CHECKING:
@@ -84,6 +87,35 @@ async def test_service_delete() -> None:
     assert author is deleted
 
 
+async def test_service_create_many() -> None:
+    """Test repository bulk create action."""
+    authors = [domain.authors.Author(name=name) for name in ("one", "two")]
+    resp = await domain.authors.Service().create_many(authors)
+    assert [author.name for author in resp] == ["one", "two"]
+
+
+async def test_service_update_many() -> None:
+    """Test repository bulk update action sets the identifier of each item."""
+    service_obj = domain.authors.Service()
+    authors = await service_obj.list()
+    updates = [
+        (author.id, domain.authors.Author(name=f"name {i}")) for i, author in enumerate(authors)
+    ]
+    resp = await service_obj.update_many(updates)
+    assert [(author.id, author.name) for author in resp] == [
+        (author.id, f"name {i}") for i, author in enumerate(authors)
+    ]
+
+
+async def test_service_delete_many() -> None:
+    """Test repository bulk delete action."""
+    service_obj = domain.authors.Service()
+    authors = await service_obj.list()
+    deleted = await service_obj.delete_many([author.id for author in authors])
+    assert deleted == authors
+    assert await service_obj.list() == []
+
+
 async def test_service_new_context_manager() -> None:
     """Simple test of `Service.new()` context manager behavior."""
     async with service.Service[domain.authors.Author].new() as service_obj:
@@ -98,7 +130,95 @@ async def test_service_method_default_behavior() -> None:
     assert await service_obj.list() == []
     assert await service_obj.update("abc", data) is data
     assert await service_obj.upsert("abc", data) is data
+    assert await service_obj.create_many([data]) == [data]
+    assert await service_obj.update_many([("abc", data)]) == [data]
+    assert await service_obj.delete_many(["abc"]) == []
     with pytest.raises(NotFoundError):
         await service_obj.get("abc")
     with pytest.raises(NotFoundError):
         await service_obj.delete("abc")
+
+
+def test_service_identity_uses_qualified_name() -> None:
+    """Test that nested service types of the same name are registered separately."""
+
+    class First:
+        """Namespace for a service type."""
+
+        class Service(service.Service):
+            """Service type."""
+
+    class Second:
+        """Namespace for a service type of the same name."""
+
+        class Service(service.Service):
+            """Service type."""
+
+    assert First.Service.__id__ != Second.Service.__id__
+    assert constants.SERVICE_OBJECT_IDENTITY_MAP[First.Service.__id__] is First.Service
+    assert constants.SERVICE_OBJECT_IDENTITY_MAP[Second.Service.__id__] is Second.Service
+
+
+def test_service_identity_map_does_not_keep_service_types_alive() -> None:
+    """Test that unreferenced service types are dropped from the identity map."""
+
+    class Service(service.Service):
+        """Service type."""
+
+    service_id = Service.__id__
+    assert service_id in constants.SERVICE_OBJECT_IDENTITY_MAP
+    del Service
+    gc.collect()
+    assert service_id not in constants.SERVICE_OBJECT_IDENTITY_MAP
+
+
+def test_service_instance_slots() -> None:
+    """Test that a slotted service subclass has no instance `__dict__`."""
+
+    class Service(RepositoryService[domain.authors.Author]):
+        """Service declaring no extra instance state."""
+
+        __slots__ = ()
+        repository_type = domain.authors.Repository
+
+    service_obj = Service(session=AsyncMock())
+    assert not hasattr(service_obj, "__dict__")
+
+
+async def test_repository_service_new_context_manager(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `RepositoryService.new()` opens a session for the service, and closes it."""
+
+    class Service(RepositoryService[domain.authors.Author]):
+        """Service with a mock repository type."""
+
+        repository_type = MagicMock()
+
+    session = AsyncMock()
+    monkeypatch.setattr(
+        "starlite_saqlalchemy.service.sqlalchemy.async_session_factory", lambda: session
+    )
+    async with Service.new() as service_obj:
+        assert isinstance(service_obj, Service)
+        Service.repository_type.assert_called_once_with(session=session)
+        session.__aexit__.assert_not_called()
+    session.__aexit__.assert_awaited_once_with(None, None, None)
+
+
+async def test_repository_service_new_closes_session_if_service_raises(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test `RepositoryService.new()` closes the session if the service can't be constructed."""
+
+    class Service(RepositoryService[domain.authors.Author]):
+        """Service with a repository type that raises."""
+
+        repository_type = MagicMock(side_effect=RuntimeError)
+
+    session = AsyncMock()
+    monkeypatch.setattr(
+        "starlite_saqlalchemy.service.sqlalchemy.async_session_factory", lambda: session
+    )
+    with pytest.raises(RuntimeError):
+        async with Service.new():
+            pass
+    session.close.assert_awaited_once()
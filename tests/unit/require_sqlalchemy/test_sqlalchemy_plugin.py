@@ -35,3 +35,18 @@ async def test_before_send_handler_error_response(
     http_response_start["status"] = random.randint(300, 599)
     await sqlalchemy_plugin.before_send_handler(http_response_start, app.state, http_scope)
     mock_session.rollback.assert_awaited_once()
+
+
+async def test_before_send_handler_ignores_body_messages(
+    app: Starlite, http_scope: HTTPScope
+) -> None:
+    """Test that the session is left open for messages that don't end the session."""
+    mock_session = MagicMock(spec=AsyncSession)
+    http_scope[SESSION_SCOPE_KEY] = mock_session  # type:ignore[literal-required]
+    await sqlalchemy_plugin.before_send_handler(
+        {"type": "http.response.body", "body": b"", "more_body": False},
+        app.state,
+        http_scope,
+    )
+    mock_session.close.assert_not_called()
+    assert http_scope[SESSION_SCOPE_KEY] is mock_session  # type:ignore[literal-required]
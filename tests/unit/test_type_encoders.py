@@ -0,0 +1,29 @@
+"""Tests for type_encoders.py."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from pathlib import PosixPath
+from uuid import uuid4
+
+import pytest
+from asyncpg.pgproto import pgproto
+
+from starlite_saqlalchemy import type_encoders
+
+
+def test_serializer_exact_type() -> None:
+    """Test values are serialized by the encoder registered for their type."""
+    uuid = uuid4()
+    assert type_encoders.serializer(pgproto.UUID(str(uuid))) == str(uuid)
+
+
+def test_serializer_subclass() -> None:
+    """Test values of subclasses are serialized by the encoder of a base class."""
+    assert type_encoders.serializer(PosixPath("/a/b")) == "/a/b"
+    assert PosixPath in type_encoders._inherited_encoders
+
+
+def test_serializer_unsupported_type() -> None:
+    """Test that unsupported types raise."""
+    with pytest.raises(TypeError):
+        type_encoders.serializer(object())